@@ -43,6 +43,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // Social sharing buttons (news page)
     initShareButtons();
 
+    // Older news cards from the JSON archive, loaded on scroll (news page)
+    initNewsArchive();
+
     // Enforce rel attributes on external links opened in new tabs.
     document.querySelectorAll('a[target="_blank"]').forEach(link => {
         const rel = (link.getAttribute('rel') || '').split(' ').filter(Boolean);
@@ -96,6 +99,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 btn.classList.remove('active');
             });
             // Show all cards
+            activeFilter = null;
             const cards = document.querySelectorAll('.resource-card');
             cards.forEach(card => {
                 getToggleTarget(card).style.display = '';
@@ -131,6 +135,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 }
                 // Apply the filter
                 if (categoryParam === 'all') {
+                    activeFilter = null;
                     document.querySelectorAll('.resource-card').forEach(function(card) {
                         getToggleTarget(card).style.display = '';
                     });
@@ -175,6 +180,7 @@ document.addEventListener('DOMContentLoaded', function() {
             // Filter by category
             if (category === 'all') {
                 // Show all cards
+                activeFilter = null;
                 const cards = document.querySelectorAll('.resource-card');
                 cards.forEach(card => {
                     getToggleTarget(card).style.display = '';
@@ -248,6 +254,8 @@ document.addEventListener('DOMContentLoaded', function() {
 function generateTagFilters() {
     const container = document.getElementById('allTagsContainer');
     if (!container) return;
+    // Regenerated when archive cards are added; keep "Show all tags" open
+    const wasExpanded = container.dataset.expanded === 'true';
     container.innerHTML = '';
 
     // Count occurrences of each tag text
@@ -266,7 +274,7 @@ function generateTagFilters() {
     });
 
     // Track expanded state
-    let isExpanded = false;
+    let isExpanded = wasExpanded;
     const TOP_N = 20;
 
     // Function to render tags (top N or all)
@@ -275,6 +283,7 @@ function generateTagFilters() {
         Array.from(container.querySelectorAll('.tag-filter')).forEach(btn => btn.remove());
         Array.from(container.querySelectorAll('.toggle-tags-btn')).forEach(btn => btn.remove());
 
+        container.dataset.expanded = String(showAll);
         const tagsToRender = showAll ? sortedTags : sortedTags.slice(0, TOP_N);
 
         tagsToRender.forEach(tagText => {
@@ -313,8 +322,8 @@ function generateTagFilters() {
         }
     };
 
-    // Initial render: top N tags only
-    renderTags(false);
+    // Initial render: top N tags only, unless the full list was open
+    renderTags(isExpanded);
 }
 
 // Friendly display names for news source slugs
@@ -390,6 +399,7 @@ function generateSourceFilters() {
 
 // Filter cards by data-source attribute
 function filterBySource(slug) {
+    activeFilter = { type: 'source', value: slug };
     var cards = document.querySelectorAll('.resource-card');
     cards.forEach(function (card) {
         getToggleTarget(card).style.display = card.dataset.source === slug ? '' : 'none';
@@ -397,6 +407,24 @@ function filterBySource(slug) {
     if (typeof updateVisibleCount === 'function') updateVisibleCount();
 }
 
+// The filter currently applied to the cards ({type, value}, or null when
+// all are shown), so cards appended later can be filtered the same way
+let activeFilter = null;
+
+function reapplyActiveFilter() {
+    if (!activeFilter) {
+        updateVisibleCount();
+    } else if (activeFilter.type === 'source') {
+        filterBySource(activeFilter.value);
+    } else if (activeFilter.type === 'tag') {
+        filterByTagText(activeFilter.value);
+    } else if (activeFilter.type === 'section') {
+        filterBySection(activeFilter.value);
+    } else {
+        filterResources(activeFilter.value);
+    }
+}
+
 let previewMap = {};
 
 function loadPreviewMap() {
@@ -413,6 +441,7 @@ function loadPreviewMap() {
 
 // Filter cards by tag text (case-insensitive)
 function filterByTagText(tagText) {
+    activeFilter = { type: 'tag', value: tagText };
     const search = tagText.toLowerCase();
     const cards = document.querySelectorAll('.resource-card');
     cards.forEach(card => {
@@ -435,6 +464,7 @@ const categorySectionMap = {
 function filterBySection(category) {
     const sectionId = categorySectionMap[category];
     if (!sectionId) return;
+    activeFilter = { type: 'section', value: category };
     const cards = document.querySelectorAll('.resource-card');
     cards.forEach(card => {
         const section = card.closest('.category-section');
@@ -555,6 +585,7 @@ function getToggleTarget(card) {
 }
 
 function filterResources(searchTerm) {
+    activeFilter = searchTerm ? { type: 'search', value: searchTerm } : null;
     // Use cached cards or query if not available
     const cards = domCache.cards.length > 0 ? domCache.cards : document.querySelectorAll('.resource-card');
     
@@ -790,31 +821,182 @@ function buildSuggestionIndex() {
 function initShareButtons() {
     if (!document.body.classList.contains('news-page')) return;
 
-    document.querySelectorAll('.resource-card').forEach(card => {
-        const cardLink = card.closest('.card-link');
-        if (!cardLink) return;
+    document.querySelectorAll('.resource-card').forEach(addShareButtons);
+}
+
+function addShareButtons(card) {
+    const cardLink = card.closest('.card-link');
+    if (!cardLink) return;
+
+    const url = cardLink.href;
+    const title = card.querySelector('h3')?.textContent.trim() || '';
+    const encodedUrl = encodeURIComponent(url);
+    const encodedTitle = encodeURIComponent(title);
+
+    const container = document.createElement('div');
+    container.className = 'share-buttons';
+
+    container.innerHTML =
+        `<a href="https://www.linkedin.com/sharing/share-offsite/?url=${encodedUrl}" class="share-btn share-btn--linkedin" target="_blank" rel="noopener noreferrer" aria-label="Share on LinkedIn" title="Share on LinkedIn">in</a>` +
+        `<a href="https://twitter.com/intent/tweet?url=${encodedUrl}&text=${encodedTitle}" class="share-btn share-btn--twitter" target="_blank" rel="noopener noreferrer" aria-label="Share on X" title="Share on X">X</a>` +
+        `<a href="https://bsky.app/intent/compose?text=${encodedTitle}%20${encodedUrl}" class="share-btn share-btn--bluesky" target="_blank" rel="noopener noreferrer" aria-label="Share on Bluesky" title="Share on Bluesky">🦋</a>` +
+        `<a href="https://www.reddit.com/submit?url=${encodedUrl}&title=${encodedTitle}" class="share-btn share-btn--reddit" target="_blank" rel="noopener noreferrer" aria-label="Share on Reddit" title="Share on Reddit">r/</a>`;
+
+    // Prevent share button clicks from navigating the parent card-link
+    container.addEventListener('click', function(e) {
+        e.stopPropagation();
+    });
+
+    card.appendChild(container);
+}
+
+// =========================================================================
+// NEWS ARCHIVE (News page)
+// =========================================================================
+
+// news.html only carries the newest cards; older ones are in JSON shards
+// written by update_news.py and listed newest first in index.json.
+const NEWS_ARCHIVE_DIR = 'news-archive/';
+
+function initNewsArchive() {
+    if (!document.body.classList.contains('news-page')) return;
+    if (!('IntersectionObserver' in window)) return;
+    const grid = document.querySelector('.resource-grid');
+    if (!grid) return;
+
+    const seen = new Set(Array.from(grid.querySelectorAll('a.card-link')).map(a => a.getAttribute('href')));
+    const sentinel = document.createElement('div');
+    sentinel.className = 'archive-sentinel';
+    sentinel.setAttribute('aria-hidden', 'true');
+    grid.after(sentinel);
+
+    let shards = null;
+    let loading = false;
+
+    const stop = () => {
+        observer.disconnect();
+        sentinel.remove();
+    };
+
+    const loadNext = () => {
+        if (loading) return;
+        loading = true;
+        const ready = shards ? Promise.resolve(shards) : fetch(NEWS_ARCHIVE_DIR + 'index.json')
+            .then(resp => resp.ok ? resp.json() : {})
+            .then(index => { shards = (index.shards || []).slice(); return shards; });
+
+        ready
+            .then(list => {
+                const next = list.shift();
+                if (!next) {
+                    stop();
+                    return;
+                }
+                return fetch(NEWS_ARCHIVE_DIR + encodeURIComponent(next.file))
+                    .then(resp => resp.ok ? resp.json() : {})
+                    .then(shard => appendArchiveItems(grid, shard.items || [], seen));
+            })
+            .catch(stop)
+            .finally(() => {
+                loading = false;
+                // A shard of cards already on the page adds nothing; keep going
+                // while the sentinel is still near the viewport.
+                if (sentinel.isConnected && sentinel.getBoundingClientRect().top < window.innerHeight + 600) {
+                    loadNext();
+                }
+            });
+    };
 
-        const url = cardLink.href;
-        const title = card.querySelector('h3')?.textContent.trim() || '';
-        const encodedUrl = encodeURIComponent(url);
-        const encodedTitle = encodeURIComponent(title);
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) loadNext();
+    }, { rootMargin: '0px 0px 600px 0px' });
+    observer.observe(sentinel);
+}
 
-        const container = document.createElement('div');
-        container.className = 'share-buttons';
+function appendArchiveItems(grid, items, seen) {
+    const fragment = document.createDocumentFragment();
+    items.forEach(item => {
+        if (!item.link || seen.has(item.link) || !/^https?:\/\//i.test(item.link)) return;
+        seen.add(item.link);
+        const cardLink = buildArchiveCard(item);
+        fragment.appendChild(cardLink);
+        addShareButtons(cardLink.firstChild);
+    });
+    if (!fragment.childNodes.length) return;
+    grid.appendChild(fragment);
 
-        container.innerHTML =
-            `<a href="https://www.linkedin.com/sharing/share-offsite/?url=${encodedUrl}" class="share-btn share-btn--linkedin" target="_blank" rel="noopener noreferrer" aria-label="Share on LinkedIn" title="Share on LinkedIn">in</a>` +
-            `<a href="https://twitter.com/intent/tweet?url=${encodedUrl}&text=${encodedTitle}" class="share-btn share-btn--twitter" target="_blank" rel="noopener noreferrer" aria-label="Share on X" title="Share on X">X</a>` +
-            `<a href="https://bsky.app/intent/compose?text=${encodedTitle}%20${encodedUrl}" class="share-btn share-btn--bluesky" target="_blank" rel="noopener noreferrer" aria-label="Share on Bluesky" title="Share on Bluesky">🦋</a>` +
-            `<a href="https://www.reddit.com/submit?url=${encodedUrl}&title=${encodedTitle}" class="share-btn share-btn--reddit" target="_blank" rel="noopener noreferrer" aria-label="Share on Reddit" title="Share on Reddit">r/</a>`;
+    domCache.cards = document.querySelectorAll('.resource-card');
+    addIconsToCards();
 
-        // Prevent share button clicks from navigating the parent card-link
-        container.addEventListener('click', function(e) {
-            e.stopPropagation();
+    // Recount the source and tag buttons over every card now on the page,
+    // keeping the pressed one pressed, then filter the new cards like the rest
+    const pressed = document.querySelector('.source-filter.active, .tag-filter.active');
+    generateSourceFilters();
+    generateTagFilters();
+    if (pressed) {
+        const key = pressed.classList.contains('source-filter') ? 'source' : 'tag';
+        document.querySelectorAll('.' + key + '-filter').forEach(btn => {
+            if (btn.dataset[key] === pressed.dataset[key]) {
+                btn.classList.add('active');
+                btn.setAttribute('aria-pressed', 'true');
+            }
         });
+    }
+    reapplyActiveFilter();
+}
+
+// Same markup as render_card() in update_news.py, built without innerHTML
+function buildArchiveCard(item) {
+    const cardLink = document.createElement('a');
+    cardLink.href = item.link;
+    cardLink.className = 'card-link';
+    cardLink.target = '_blank';
+    cardLink.rel = 'noopener noreferrer';
+
+    const card = document.createElement('div');
+    card.className = 'resource-card';
+    card.dataset.category = item.category || '';
+    if (item.source_slug) card.dataset.source = item.source_slug;
+    if (item.tooltip) card.dataset.tooltip = item.tooltip;
+
+    if (item.source_slug) {
+        const img = document.createElement('img');
+        img.src = 'img/news-banners/' + encodeURIComponent(item.source_slug) + '.jpg';
+        img.alt = item.source || '';
+        img.className = 'resource-preview';
+        img.loading = 'lazy';
+        card.appendChild(img);
+    }
 
-        card.appendChild(container);
+    const title = document.createElement('h3');
+    title.textContent = item.title || '';
+    card.appendChild(title);
+
+    const date = document.createElement('p');
+    date.className = 'article-date';
+    date.textContent = item.date || '';
+    card.appendChild(date);
+
+    const summary = document.createElement('p');
+    summary.textContent = (item.summary || '') + ' ';
+    const source = document.createElement('span');
+    source.className = 'source';
+    source.textContent = '(' + (item.source_label || item.source || '') + ')';
+    summary.appendChild(source);
+    card.appendChild(summary);
+
+    const tags = document.createElement('div');
+    tags.className = 'resource-tags';
+    (item.tags || []).forEach(text => {
+        const tag = document.createElement('span');
+        tag.className = 'tag';
+        tag.textContent = text;
+        tags.appendChild(tag);
     });
+    card.appendChild(tags);
+
+    cardLink.appendChild(card);
+    return cardLink;
 }
 
 // =========================================================================
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Checks feed.json against the JSON Feed 1.1 item rules
+
+Run from the repository root:
+    python3 -m unittest discover tests
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import update_news  # noqa: E402
+
+
+ENTRIES = [
+    {
+        "title": "Critical flaw in AWS IAM policy evaluation",
+        "link": "https://example.com/aws-iam",
+        "summary": "A cloud security researcher found a privilege escalation in IAM.",
+        "source": "Example Security",
+        "published": "2026-05-01T10:00:00Z",
+    },
+    {
+        # No summary: the item still needs content
+        "title": "Kubernetes vulnerability disclosed",
+        "link": "https://example.com/k8s",
+        "summary": "",
+        "source": "Example News",
+        "sources": ["Example News", "Other Source"],
+        "published": "2026-04-30T08:00:00Z",
+    },
+]
+
+
+def items_without_content(feed):
+    """Items that have neither a string content_text nor content_html."""
+    return [
+        item.get("id") for item in feed["items"]
+        if not any(isinstance(item.get(key), str) for key in ("content_text", "content_html"))
+    ]
+
+
+class JsonFeedTest(unittest.TestCase):
+    def test_generated_items_have_content(self):
+        writer = update_news.FeedWriter("2026-05-01T10:00:00Z")
+        for entry in ENTRIES:
+            writer.add(entry)
+        feed = json.loads(writer.json_feed())
+        self.assertEqual(feed["version"], "https://jsonfeed.org/version/1.1")
+        self.assertEqual(len(feed["items"]), len(ENTRIES))
+        self.assertEqual(items_without_content(feed), [])
+        for item in feed["items"]:
+            self.assertTrue(item["content_text"])
+
+    def test_published_feed_items_have_content(self):
+        with open(REPO_ROOT / "feed.json", "r", encoding="utf-8") as f:
+            feed = json.load(f)
+        self.assertEqual(items_without_content(feed), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Atomic, skip-unchanged writer for generated site files
+
+update_news.py, update_sri.py, generate_rss.py and normalize_urls.py all
+rewrite files that nginx serves directly. Writing through this module means:
+- A reader never sees a half-written file (temp file in the same directory,
+  then rename)
+- A file whose content is unchanged is not touched at all, so its mtime
+  stays put and mtime-based deploys (lftp mirror, rsync) and caches skip it
+- Each run can report which artifacts actually changed
+
+Usage:
+    from artifact_writer import ArtifactWriter
+
+    writer = ArtifactWriter()
+    writer.write("feed.xml", rss_xml)
+    print(writer.summary())
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+from typing import List, Optional, Union
+
+Content = Union[str, bytes]
+
+
+def _encode(content: Content) -> bytes:
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+
+def content_hash(content: Content) -> str:
+    """SHA-256 hex digest of ``content`` (str is hashed as UTF-8)."""
+    return hashlib.sha256(_encode(content)).hexdigest()
+
+
+def file_hash(path: Union[str, os.PathLike]) -> Optional[str]:
+    """SHA-256 hex digest of the file at ``path``, or None if it doesn't exist."""
+    sha256 = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                sha256.update(block)
+    except FileNotFoundError:
+        return None
+    return sha256.hexdigest()
+
+
+def atomic_write(path: Union[str, os.PathLike], content: Content) -> None:
+    """Write ``content`` via a temp file and rename, so readers never see half a file.
+
+    An existing file's permissions are kept (new files get 0644), since the
+    generated files are served as they are.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_encode(content))
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_if_changed(path: Union[str, os.PathLike], content: Content) -> bool:
+    """Atomically write ``content`` unless ``path`` already holds exactly that.
+
+    The size is compared first, so most changed files are detected without
+    reading them; equal sizes fall back to comparing content hashes.
+    Returns True if the file was written.
+    """
+    data = _encode(content)
+    try:
+        unchanged = os.stat(path).st_size == len(data) and file_hash(path) == content_hash(data)
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        return False
+    atomic_write(path, data)
+    return True
+
+
+class ArtifactWriter:
+    """Writes artifacts with write_if_changed and records which ones changed."""
+
+    def __init__(self):
+        self.changed: List[str] = []
+        self.unchanged: List[str] = []
+        self.removed: List[str] = []
+
+    def write(self, path: Union[str, os.PathLike], content: Content) -> bool:
+        path = os.fspath(path)
+        if write_if_changed(path, content):
+            self.changed.append(path)
+            return True
+        self.unchanged.append(path)
+        return False
+
+    def remove(self, path: Union[str, os.PathLike]) -> bool:
+        """Delete a stale artifact; True if it existed."""
+        path = os.fspath(path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        self.removed.append(path)
+        return True
+
+    def summary(self) -> str:
+        parts = [f"{len(self.changed)} changed", f"{len(self.unchanged)} unchanged"]
+        if self.removed:
+            parts.append(f"{len(self.removed)} removed")
+        return ", ".join(parts)
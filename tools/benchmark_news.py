@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the news pipeline in update_news.py
+
+Everything runs offline. The pipeline benchmark replays recorded feed
+bodies through a local HTTP stand-in server and times each stage of
+update_news.py separately: fetch, parse_rss, relevance filtering,
+resolve_url, render_card and build_feed_xml.
+
+Feed fixtures are the *.xml files in --fixtures (record them once with the
+"record" command). Without recorded fixtures the repo's own feed.xml, plus
+an Atom copy of it, is replayed. --synthetic adds one generated feed of any
+size to test how each stage scales. The render benchmark times every
+output rendered from a batch of synthetic entries, with and without the
+shared view cache.
+
+Usage:
+    python3 tools/benchmark_news.py classifier
+    python3 tools/benchmark_news.py classifier --repeat 5
+    python3 tools/benchmark_news.py render                 # 10,000 entries by default
+    python3 tools/benchmark_news.py record                 # save live feeds as fixtures
+    python3 tools/benchmark_news.py pipeline
+    python3 tools/benchmark_news.py pipeline --synthetic 10000 --output bench.json
+    python3 tools/benchmark_news.py pipeline --baseline bench.json
+"""
+
+import argparse
+import datetime as dt
+import html
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import update_news  # noqa: E402
+
+
+# --- Reference implementation ---------------------------------------------
+
+def _legacy_word_match(keyword: str, text: str) -> bool:
+    if len(keyword) <= 3:
+        return bool(re.search(r'\b' + re.escape(keyword) + r'\b', text))
+    return keyword in text
+
+
+def legacy_classify(text: str):
+    """The per-keyword loops update_news.py used before KeywordClassifier."""
+    lower = text.lower()
+    relevant = any(_legacy_word_match(kw, lower) for kw in update_news.KEYWORDS)
+    category = "report"
+    for name, keys in update_news.CATEGORY_KEYWORDS.items():
+        if any(_legacy_word_match(k, lower) for k in keys):
+            category = name
+            break
+    tags = [tag for tag, keys in update_news.TAG_KEYWORDS.items()
+            if any(_legacy_word_match(k, lower) for k in keys)] or ["Cloud Security"]
+    return relevant, category, tags[:3]
+
+
+def compiled_classify(text: str):
+    result = update_news.CLASSIFIER.classify(text)
+    return result.relevant, result.category, result.tags
+
+
+# --- Helpers ---------------------------------------------------------------
+
+CARD_TEXT_PATTERN = re.compile(
+    r'<h3>(.*?)</h3>\s*<p class="article-date">[^<]*</p>'
+    r'\s*<p>(.*?)<span class="source">\(([^)]*)\)</span>',
+    re.DOTALL,
+)
+
+
+def load_corpus() -> List[str]:
+    """Article texts (title, summary, source) from the cards in news.html."""
+    news_html = (REPO_ROOT / "news.html").read_text(encoding="utf-8")
+    return [html.unescape(" ".join(m.groups())) for m in CARD_TEXT_PATTERN.finditer(news_html)]
+
+
+def time_per_item(func: Callable[[str], object], texts: List[str], repeat: int) -> float:
+    """Best-of-``repeat`` wall time per text, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+
+# --- Benchmarks ------------------------------------------------------------
+
+def bench_classifier(repeat: int) -> Dict[str, float]:
+    texts = load_corpus()
+    if not texts:
+        raise SystemExit("No article cards found in news.html")
+
+    mismatches = [t for t in texts if legacy_classify(t) != compiled_classify(t)]
+    if mismatches:
+        raise SystemExit(f"Classifier disagrees with the reference on {len(mismatches)} articles, "
+                         f"e.g. {mismatches[0]!r}")
+
+    legacy_us = time_per_item(legacy_classify, texts, repeat)
+    compiled_us = time_per_item(compiled_classify, texts, repeat)
+
+    print(f"Classifier benchmark ({len(texts)} articles, best of {repeat})")
+    print(f"  per-keyword loops:  {legacy_us:8.1f} µs/article")
+    print(f"  compiled matcher:   {compiled_us:8.1f} µs/article")
+    print(f"  speedup:            {legacy_us / compiled_us:8.1f}x")
+    return {"legacy_us": legacy_us, "compiled_us": compiled_us}
+
+
+def synthetic_entries(count: int, seed: int = 1) -> List[Dict[str, str]]:
+    """``count`` parsed entries spread over the real feed names, some clustered."""
+    rng = random.Random(seed)
+    names = [feed["name"] for feed in update_news.FEEDS]
+    entries = update_news.parse_rss(synthetic_rss(count, seed), names[0], max_items=count)
+    for entry in entries:
+        entry["source"] = rng.choice(names)
+        if rng.random() < 0.1:
+            entry["sources"] = [entry["source"], rng.choice(names)]
+    return entries
+
+
+def render_outputs(entries: List[Dict[str, str]]) -> Tuple[str, ...]:
+    """Every output update_news.py renders from ``entries``: cards, feeds and archive."""
+    cards = "\n".join(update_news.render_card(entry, " " * 16) for entry in entries)
+    writer = update_news.FeedWriter(entries[0]["published"])
+    for entry in entries:
+        writer.add(entry)
+    files, _ = update_news.build_archive(entries)
+    return (cards, writer.rss(), writer.json_feed(), *writer.tag_feeds().values(), *files.values())
+
+
+def bench_render(count: int, repeat: int) -> Dict[str, float]:
+    entries = synthetic_entries(count)
+    saved = update_news.VIEWS
+    modes = {
+        # max_size=0 drops every view right away, so each output rebuilds it
+        "no view cache": lambda: update_news.ViewCache(max_size=0),
+        "cold cache": lambda: update_news.ViewCache(),
+        "warm cache": lambda: warm,
+    }
+    warm = update_news.ViewCache()
+    update_news.VIEWS = warm
+    expected = render_outputs(entries)
+    results = {}
+    try:
+        for mode, make_cache in modes.items():
+            best = float("inf")
+            for _ in range(repeat):
+                update_news.VIEWS = make_cache()
+                start = time.perf_counter()
+                outputs = render_outputs(entries)
+                best = min(best, time.perf_counter() - start)
+                if outputs != expected:
+                    raise SystemExit(f"Render output differs with {mode}")
+            results[mode] = best
+    finally:
+        update_news.VIEWS = saved
+
+    print(f"Render benchmark ({len(entries):,} entries: cards, feeds, tag feeds, archive; best of {repeat})")
+    for mode, seconds in results.items():
+        print(f"  {mode:<15}{seconds:>9.3f}s {seconds / len(entries) * 1e6:>9.1f} µs/entry")
+    return results
+
+
+# --- Feed fixtures ---------------------------------------------------------
+
+DEFAULT_FIXTURES = REPO_ROOT / ".cache" / "bench-fixtures"
+
+
+def fixture_slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def record_fixtures(fixtures_dir: Path) -> None:
+    """Download every feed in update_news.FEEDS into fixtures_dir."""
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    results = update_news.fetch_feeds(update_news.FEEDS)
+    for feed, (status, body, _) in zip(update_news.FEEDS, results):
+        if status != 200 or not body:
+            print(f"  ✗ {feed['name']}: fetch failed")
+            continue
+        path = fixtures_dir / f"{fixture_slug(feed['name'])}.xml"
+        path.write_text(body, encoding="utf-8")
+        print(f"  ✓ {feed['name']}: {len(body.encode('utf-8')):,} bytes -> {path.name}")
+
+
+def rss_to_atom(rss_text: str) -> str:
+    """Rewrite an RSS document as Atom so both parser paths get exercised."""
+    entries = []
+    for item in update_news.parse_rss(rss_text, "", max_items=10**9):
+        published = update_news.parse_date(item["published"]) or dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+        entries.append(
+            "<entry>"
+            f"<title>{escape(item['title'])}</title>"
+            f"<link rel=\"alternate\" href={quoteattr(item['link'])}/>"
+            f"<updated>{published.strftime('%Y-%m-%dT%H:%M:%SZ')}</updated>"
+            f"<summary type=\"html\">{escape('<p>' + item['summary'] + '</p>')}</summary>"
+            "</entry>"
+        )
+    return ('<?xml version="1.0" encoding="utf-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom"><title>Fixture</title>'
+            + "".join(entries) + "</feed>")
+
+
+def synthetic_rss(count: int, seed: int = 1) -> str:
+    """An RSS feed of ``count`` items built from words in the real corpus."""
+    rng = random.Random(seed)
+    words = " ".join(load_corpus()).split() or ["cloud", "security", "news"]
+    start = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+    items = []
+    for i in range(count):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(6, 14)))
+        body = " ".join(rng.choice(words) for _ in range(rng.randint(60, 400)))
+        published = start + dt.timedelta(minutes=7 * i)
+        items.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>https://bench.invalid/articles/{i}</link>"
+            f"<pubDate>{update_news.format_datetime(published)}</pubDate>"
+            f"<description>{escape('<p>' + body + '</p><img src=x.png>')}</description>"
+            "</item>"
+        )
+    return ('<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>Synthetic</title>'
+            + "".join(items) + "</channel></rss>")
+
+
+def load_fixtures(fixtures_dir: Path, synthetic: int) -> Dict[str, str]:
+    """Map feed name -> recorded body for every fixture to replay."""
+    fixtures = {path.stem: path.read_text(encoding="utf-8") for path in sorted(fixtures_dir.glob("*.xml"))}
+    if not fixtures:
+        feed_xml = (REPO_ROOT / "feed.xml").read_text(encoding="utf-8")
+        fixtures = {"site-feed-rss": feed_xml, "site-feed-atom": rss_to_atom(feed_xml)}
+    if synthetic:
+        fixtures[f"synthetic-{synthetic}"] = synthetic_rss(synthetic)
+    return fixtures
+
+
+# --- Local HTTP stand-in ------------------------------------------------------
+
+class FixtureServer:
+    """Serves fixtures at /feeds/<name> and a one-hop redirect at /r/<id> -> /a/<id>."""
+
+    def __init__(self, fixtures: Dict[str, str]):
+        bodies = {name: body.encode("utf-8") for name, body in fixtures.items()}
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _respond(self, send_body: bool):
+                if self.path.startswith("/feeds/") and self.path[7:] in bodies:
+                    body = bodies[self.path[7:]]
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/xml")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    if send_body:
+                        self.wfile.write(body)
+                elif self.path.startswith("/r/"):
+                    self.send_response(301)
+                    self.send_header("Location", "/a/" + self.path[3:])
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif self.path.startswith("/a/"):
+                    self.send_response(200)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                else:
+                    self.send_error(404)
+
+            def do_GET(self):
+                self._respond(True)
+
+            def do_HEAD(self):
+                self._respond(False)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FixtureServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# --- Pipeline benchmark -------------------------------------------------------
+
+def timed(stages: Dict[str, Dict], name: str, count: int, func: Callable[[], object]):
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    stages[name] = {
+        "seconds": round(seconds, 6),
+        "count": count,
+        "per_item_us": round(seconds / count * 1e6, 3) if count else None,
+    }
+    return result
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_pipeline(fixtures_dir: Path, synthetic: int, resolve_limit: int) -> Dict:
+    fixtures = load_fixtures(fixtures_dir, synthetic)
+    stages: Dict[str, Dict] = {}
+
+    # A large --synthetic feed is well over update_news.MAX_RESPONSE_BYTES,
+    # so fetch with a client whose cap fits the biggest fixture
+    largest = max(len(body.encode("utf-8")) for body in fixtures.values())
+    client = update_news.HttpClient(max_bytes=max(update_news.MAX_RESPONSE_BYTES, 2 * largest))
+
+    with FixtureServer(fixtures) as server:
+        feeds = [{"name": name, "url": f"{server.base_url}/feeds/{name}"} for name in fixtures]
+
+        results = timed(stages, "fetch", len(feeds), lambda: update_news.fetch_feeds(feeds, client=client))
+        client.close()
+        # A failed fetch must not be timed as an empty feed
+        failed = [(feed["name"], status) for feed, (status, _, _) in zip(feeds, results) if status != 200]
+        for name, status in failed:
+            reason = f"HTTP {status}" if status else f"request failed or body over {client.max_bytes:,} bytes"
+            print(f"  ✗ {name}: fixture not served ({reason})", file=sys.stderr)
+        if failed:
+            raise SystemExit(f"Error: {len(failed)} of {len(feeds)} fixtures could not be fetched; not benchmarking")
+        bodies = [(feed["name"], body) for feed, (_, body, _) in zip(feeds, results)]
+        total_bytes = sum(len(body.encode("utf-8")) for _, body in bodies)
+
+        def parse_all() -> List[Dict[str, str]]:
+            items = []
+            for name, body in bodies:
+                items.extend(update_news.parse_rss(body, name, max_items=10**9))
+            return items
+
+        items = timed(stages, "parse_rss", len(bodies), parse_all)
+        relevant = timed(stages, "filter", len(items), lambda: [
+            item for item in items
+            if item["title"] and item["link"]
+            and update_news.is_relevant(f"{item['title']} {item.get('summary', '')}")
+        ])
+
+        to_resolve = [f"{server.base_url}/r/{i}" for i in range(min(resolve_limit, len(relevant)))]
+        timed(stages, "resolve_url", len(to_resolve), lambda: [
+            update_news.resolve_url(url) for url in to_resolve
+        ])
+
+    # render_card and build_feed_xml share views through update_news.VIEWS.
+    # Each stage starts from an empty cache so it pays for its own views;
+    # the warm run is what a --daemon update costs and is reported apart.
+    saved = update_news.VIEWS
+    try:
+        update_news.VIEWS = update_news.ViewCache()
+        timed(stages, "render_card", len(relevant), lambda: [
+            update_news.render_card(item, " " * 16) for item in relevant
+        ])
+        update_news.VIEWS = update_news.ViewCache()
+        timed(stages, "build_feed_xml", len(relevant), lambda: update_news.build_feed_xml(
+            relevant, "2026-01-01T00:00:00Z"
+        ))
+        timed(stages, "build_feed_xml (warm)", len(relevant), lambda: update_news.build_feed_xml(
+            relevant, "2026-01-01T00:00:00Z"
+        ))
+    finally:
+        update_news.VIEWS = saved
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "timestamp": dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "fixtures": sorted(fixtures),
+            "feed_bytes": total_bytes,
+            "items": len(items),
+            "relevant_items": len(relevant),
+        },
+        "stages": stages,
+    }
+
+
+def print_pipeline(report: Dict, baseline: Optional[Dict]) -> None:
+    meta = report["meta"]
+    print(f"Pipeline benchmark @ {meta['revision'] or 'working tree'} "
+          f"({len(meta['fixtures'])} feeds, {meta['feed_bytes']:,} bytes, "
+          f"{meta['items']:,} items, {meta['relevant_items']:,} relevant)")
+    header = f"  {'stage':<22}{'count':>8}{'seconds':>12}{'µs/item':>12}"
+    if baseline:
+        header += f"{'vs base':>10}"
+    print(header)
+    for name, stage in report["stages"].items():
+        per_item = f"{stage['per_item_us']:.1f}" if stage["per_item_us"] is not None else "-"
+        line = f"  {name:<22}{stage['count']:>8,}{stage['seconds']:>12.4f}{per_item:>12}"
+        # Compare per-item cost so runs with different fixture sizes stay comparable.
+        base = (baseline or {}).get("stages", {}).get(name)
+        if base and base.get("per_item_us") and stage["per_item_us"] is not None:
+            line += f"{(stage['per_item_us'] / base['per_item_us'] - 1) * 100:>+9.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the update_news.py pipeline offline")
+    parser.add_argument("benchmark", choices=["classifier", "pipeline", "render", "record"])
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions; the best time is reported")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES,
+                        help="Directory of recorded feed bodies (*.xml)")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Also replay a generated feed with this many items")
+    parser.add_argument("--entries", type=int, default=10000,
+                        help="Number of synthetic entries for the render benchmark")
+    parser.add_argument("--resolve-limit", type=int, default=200,
+                        help="Resolve at most this many links through the local redirect")
+    parser.add_argument("--output", type=Path, help="Write pipeline results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Earlier --output file to compare against")
+    args = parser.parse_args()
+
+    if args.benchmark == "classifier":
+        bench_classifier(args.repeat)
+    elif args.benchmark == "render":
+        bench_render(args.entries, args.repeat)
+    elif args.benchmark == "record":
+        record_fixtures(args.fixtures)
+    else:
+        report = bench_pipeline(args.fixtures, args.synthetic, args.resolve_limit)
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else None
+        print_pipeline(report, baseline)
+        if args.output:
+            args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+            print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,8 @@ Check all URLs across all HTML files on the site for safety.
 
 Three-phase pipeline:
   1. Extract  — collect all URLs from all HTML files, deduplicate
-  2. Resolve  — batch-resolve unique URLs concurrently (skip whitelisted domains)
+  2. Resolve  — batch-resolve unique URLs concurrently (skip whitelisted domains);
+                lookups are cached between runs, --refresh ignores the cache
   3. Check    — run safety checks on resolved URLs, per file
 """
 
@@ -50,6 +51,7 @@ def extract_urls_from_html(file_path):
 
 def main():
     no_resolve = '--no-resolve' in sys.argv
+    refresh = '--refresh' in sys.argv
 
     # Find all HTML files
     workspace_root = Path(__file__).parent.parent
@@ -83,7 +85,7 @@ def main():
     resolution_map = {}
     if not no_resolve:
         print("Resolving URLs (skipping whitelisted domains)...")
-        resolution_map = resolve_urls_concurrent(all_unique_urls)
+        resolution_map = resolve_urls_concurrent(all_unique_urls, refresh=refresh)
 
         resolved_count = sum(1 for u, (r, _) in resolution_map.items() if r != u)
         error_count = sum(1 for _, (_, e) in resolution_map.items() if e)
@@ -13,16 +13,22 @@ Usage:
     python3 tools/check_url_safety.py --batch urls.txt
     python3 tools/check_url_safety.py --interactive
     python3 tools/check_url_safety.py --no-resolve <url>
+    python3 tools/check_url_safety.py --refresh <url>   # ignore cached redirects
 """
 
+import asyncio
 import sys
 import re
 import urllib.request
 import urllib.error
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from urllib.parse import urlparse
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+sys.path.insert(0, str(Path(__file__).parent))
+from url_cache import ResolutionCache
 
 # Suspicious patterns that might indicate malicious URLs
 SUSPICIOUS_PATTERNS = [
@@ -35,7 +41,10 @@ SUSPICIOUS_PATTERNS = [
     r'-{10,}',  # Excessive dashes (obfuscation technique)
 ]
 
-# Domains known to be URL shorteners/redirectors — checked by exact domain match
+# Domain lists below match a host that is the listed domain or one of its
+# subdomains ('google.com' matches mail.google.com, not google.com.evil.io)
+
+# Domains known to be URL shorteners/redirectors
 SHORTENER_DOMAINS = [
     'bit.ly', 'goo.gl', 'tinyurl.com', 'ow.ly', 't.co',
     'is.gd', 'buff.ly', 'rebrand.ly', 'cutt.ly', 'shorturl.at',
@@ -65,12 +74,65 @@ WHITELIST = [
     'wikipedia.org',
 ]
 
+# Redirect resolution limits: requests in flight overall and per host, and the
+# minimum gap between two requests starting on the same host, so a page with
+# hundreds of links to one site doesn't hammer it
+MAX_CONCURRENCY = 10
+PER_HOST_CONCURRENCY = 2
+HOST_DELAY = 0.25  # seconds
+
+# Tags this tool's rows in the shared resolution cache (HEAD, then GET, with
+# a browser User-Agent); other tools' failures are not reused
+RESOLVER_NAME = 'check_url_safety'
+
+
+def host_of(netloc: str) -> str:
+    """The bare host of a URL's netloc: no credentials, port or trailing dot, lowercased."""
+    host = netloc.rpartition('@')[2]
+    if host.startswith('['):  # IPv6 literal
+        return host.partition(']')[0].lstrip('[').lower()
+    return host.partition(':')[0].rstrip('.').lower()
+
+
+class DomainIndex:
+    """Set of domains that matches hosts on label boundaries.
+
+    A host matches if it is a listed domain or a subdomain of one, so
+    'google.com' matches google.com and mail.google.com but not
+    google.com.evil.io or notgoogle.com. Lookups hash each suffix of the
+    host (mail.google.com, google.com, com), so their cost depends on the
+    number of labels in the host, not the number of domains listed.
+    """
+
+    def __init__(self, domains: Iterable[str]):
+        self.domains = frozenset(host_of(d.strip()) for d in domains if d.strip())
+
+    def match(self, host: str) -> Optional[str]:
+        """The most specific listed domain that ``host`` falls under, or None."""
+        host = host_of(host)
+        while host:
+            if host in self.domains:
+                return host
+            host = host.partition('.')[2]
+        return None
+
+    def __contains__(self, host: str) -> bool:
+        return self.match(host) is not None
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+
+# Built once; rebuild them if the lists above are changed at runtime
+SHORTENER_INDEX = DomainIndex(SHORTENER_DOMAINS)
+BLOCKLIST_INDEX = DomainIndex(BLOCKLIST)
+WHITELIST_INDEX = DomainIndex(WHITELIST)
+
 
 def is_shortener_domain(url: str) -> bool:
     """Check if the URL's domain is a known URL shortener."""
     try:
-        domain = urlparse(url).netloc.lower()
-        return any(domain == sd or domain.endswith('.' + sd) for sd in SHORTENER_DOMAINS)
+        return urlparse(url).netloc in SHORTENER_INDEX
     except Exception:
         return False
 
@@ -80,6 +142,12 @@ def resolve_url(url: str, timeout: int = 5) -> Tuple[str, Optional[str]]:
 
     Uses HEAD first; falls back to GET if HEAD gets 405 Method Not Allowed.
     """
+    final, _, error = resolve_url_status(url, timeout)
+    return final, error
+
+
+def resolve_url_status(url: str, timeout: int = 5) -> Tuple[str, Optional[int], Optional[str]]:
+    """resolve_url, plus the HTTP status of the last response (None if there was none)."""
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -95,8 +163,8 @@ def resolve_url(url: str, timeout: int = 5) -> Tuple[str, Optional[str]]:
             with urllib.request.urlopen(req, timeout=timeout) as resp:
                 final = resp.url
                 if final and final != url:
-                    return final, None
-                return url, None
+                    return final, resp.status, None
+                return url, resp.status, None
         except urllib.error.HTTPError as e:
             if method == "HEAD" and (e.code == 405 or e.code >= 400):
                 continue  # HEAD is unreliable on many hosts; try GET
@@ -104,26 +172,85 @@ def resolve_url(url: str, timeout: int = 5) -> Tuple[str, Optional[str]]:
             if e.code == 308:
                 location = e.headers.get("Location")
                 if location:
-                    return location, None
-            return url, f"HTTP {e.code}"
+                    return location, e.code, None
+            return url, e.code, f"HTTP {e.code}"
         except Exception as e:
-            return url, str(e)
-    return url, None
+            return url, None, str(e)
+    return url, None, None
+
+
+async def resolve_urls_async(
+    urls: List[str],
+    max_concurrency: int = MAX_CONCURRENCY,
+    timeout: int = 5,
+    per_host: int = PER_HOST_CONCURRENCY,
+    host_delay: float = HOST_DELAY,
+    cache: Optional[ResolutionCache] = None,
+) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Resolve ``urls`` with resolve_url, returning {original: (resolved, error)}.
+
+    At most ``max_concurrency`` requests run at once, at most ``per_host`` of
+    them against the same host, and requests to one host start at least
+    ``host_delay`` seconds apart. resolve_url blocks, so each call runs in a
+    thread pool sized to ``max_concurrency``. Every outcome is recorded in
+    ``cache`` when one is given.
+    """
+    loop = asyncio.get_running_loop()
+    overall = asyncio.Semaphore(max_concurrency)
+    host_slots: Dict[str, asyncio.Semaphore] = {}
+    next_start: Dict[str, float] = {}
+
+    async def resolve_one(url: str, executor: ThreadPoolExecutor) -> Tuple[str, Optional[str]]:
+        host = urlparse(url).netloc.lower()
+        # Wait for the host first, so queued requests to a busy host don't
+        # hold global slots that other hosts could use
+        async with host_slots.setdefault(host, asyncio.Semaphore(per_host)):
+            now = loop.time()
+            start = max(now, next_start.get(host, now))
+            next_start[host] = start + host_delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            async with overall:
+                try:
+                    final, status, error = await loop.run_in_executor(
+                        executor, resolve_url_status, url, timeout)
+                except Exception as e:
+                    final, status, error = url, None, str(e)
+        if cache is not None:
+            cache.record(url, final, status, error)
+        return final, error
+
+    unique = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        resolved = await asyncio.gather(*(resolve_one(url, executor) for url in unique))
+    return dict(zip(unique, resolved))
 
 
 def resolve_urls_concurrent(
     urls: List[str],
-    max_workers: int = 10,
+    max_workers: int = MAX_CONCURRENCY,
     timeout: int = 5,
-    skip_domains: Optional[List[str]] = None,
+    skip_domains: Optional[Union[DomainIndex, Iterable[str]]] = None,
+    per_host: int = PER_HOST_CONCURRENCY,
+    host_delay: float = HOST_DELAY,
+    use_cache: bool = True,
+    refresh: bool = False,
 ) -> Dict[str, Tuple[str, Optional[str]]]:
     """Resolve multiple URLs concurrently, returning {original: (resolved, error)}.
 
-    URLs whose domain is in skip_domains are returned unchanged without
-    making HTTP requests.
+    URLs whose domain is in skip_domains (a DomainIndex or a list of
+    domains, matched with their subdomains) are returned unchanged without
+    making HTTP requests. The rest are looked up in the shared resolution
+    cache (see url_cache.py; only this tool's failures count) unless
+    ``use_cache`` is False; ``refresh``
+    ignores cached entries but still records the new outcomes. Whatever is
+    left goes through resolve_urls_async; ``max_workers`` is its overall
+    concurrency.
     """
     if skip_domains is None:
-        skip_domains = WHITELIST
+        skip_domains = WHITELIST_INDEX
+    elif not isinstance(skip_domains, DomainIndex):
+        skip_domains = DomainIndex(skip_domains)
 
     results: Dict[str, Tuple[str, Optional[str]]] = {}
     to_resolve: List[str] = []
@@ -135,7 +262,7 @@ def resolve_urls_concurrent(
             results[url] = (url, None)
             continue
 
-        if any(wd in domain for wd in skip_domains):
+        if domain in skip_domains:
             results[url] = (url, None)
         else:
             to_resolve.append(url)
@@ -143,19 +270,22 @@ def resolve_urls_concurrent(
     if not to_resolve:
         return results
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {
-            executor.submit(resolve_url, url, timeout): url
-            for url in to_resolve
-        }
-        for future in as_completed(future_to_url):
-            original = future_to_url[future]
-            try:
-                resolved, error = future.result()
-                results[original] = (resolved, error)
-            except Exception as e:
-                results[original] = (original, str(e))
-
+    cache = ResolutionCache(RESOLVER_NAME) if use_cache else None
+    try:
+        if cache is not None and not refresh:
+            for url, entry in cache.lookup_many(to_resolve).items():
+                results[url] = (entry.final, entry.error)
+            to_resolve = [url for url in to_resolve if url not in results]
+        if to_resolve:
+            results.update(asyncio.run(resolve_urls_async(
+                to_resolve, max_concurrency=max_workers, timeout=timeout,
+                per_host=per_host, host_delay=host_delay, cache=cache,
+            )))
+        if cache is not None:
+            cache.save()
+    finally:
+        if cache is not None:
+            cache.close()
     return results
 
 
@@ -223,16 +353,15 @@ class URLSafetyChecker:
             return self._result(False, url, resolved_url)
 
         # Check against blocklist
-        for blocked in BLOCKLIST:
-            if blocked in domain:
-                self.errors.append(f"Domain '{domain}' is on blocklist")
-                return self._result(False, url, resolved_url)
+        if domain in BLOCKLIST_INDEX:
+            self.errors.append(f"Domain '{domain}' is on blocklist")
+            return self._result(False, url, resolved_url)
 
         # Check if whitelisted (skip pattern checks)
-        is_whitelisted = any(whitelist in domain for whitelist in WHITELIST)
+        is_whitelisted = domain in WHITELIST_INDEX
 
         if not is_whitelisted:
-            # Check if it's a URL shortener (exact domain match)
+            # Check if it's a URL shortener
             if is_shortener_domain(check_target):
                 self.warnings.append(f"URL shortener domain: {domain}")
 
@@ -266,13 +395,17 @@ class URLSafetyChecker:
             'resolved_url': resolved_url if redirected else None,
         }
 
-    def check_batch(self, urls: List[str], resolve: bool = True) -> List[Tuple[str, Dict]]:
-        """Check multiple URLs, optionally resolving redirects first."""
+    def check_batch(self, urls: List[str], resolve: bool = True,
+                    refresh: bool = False) -> List[Tuple[str, Dict]]:
+        """Check multiple URLs, optionally resolving redirects first.
+
+        ``refresh`` re-resolves URLs even if the resolution cache has them.
+        """
         results = []
 
         if resolve:
             unique_urls = list(dict.fromkeys(urls))
-            resolution_map = resolve_urls_concurrent(unique_urls)
+            resolution_map = resolve_urls_concurrent(unique_urls, refresh=refresh)
 
             for url in urls:
                 resolved, error = resolution_map.get(url, (url, None))
@@ -327,7 +460,7 @@ def interactive_mode():
             if not url:
                 continue
 
-            resolved, error = resolve_url(url)
+            resolved, error = resolve_urls_concurrent([url], skip_domains=[])[url]
             result = checker.check_url(url, resolved_url=resolved, resolve_error=error)
             print_result(url, result)
 
@@ -349,10 +482,12 @@ def main():
         print("  Batch file:    python3 tools/check_url_safety.py --batch urls.txt")
         print("  Interactive:   python3 tools/check_url_safety.py --interactive")
         print("  No resolution: python3 tools/check_url_safety.py --no-resolve <url>")
+        print("  Fresh lookups: python3 tools/check_url_safety.py --refresh <url>")
         sys.exit(1)
 
     resolve = '--no-resolve' not in sys.argv
-    args = [a for a in sys.argv[1:] if a != '--no-resolve']
+    refresh = '--refresh' in sys.argv
+    args = [a for a in sys.argv[1:] if a not in ('--no-resolve', '--refresh')]
 
     checker = URLSafetyChecker()
 
@@ -375,7 +510,7 @@ def main():
             print(f"Error: File '{filename}' not found")
             sys.exit(1)
 
-        results = checker.check_batch(urls, resolve=resolve)
+        results = checker.check_batch(urls, resolve=resolve, refresh=refresh)
 
         safe_count = sum(1 for _, r in results if r['safe'])
         unsafe_count = sum(1 for _, r in results if not r['safe'])
@@ -399,7 +534,8 @@ def main():
     else:
         url = args[0]
         if resolve:
-            resolved, error = resolve_url(url)
+            # Whitelisted domains are resolved too when checking a single URL
+            resolved, error = resolve_urls_concurrent([url], skip_domains=[], refresh=refresh)[url]
         else:
             resolved, error = url, None
         result = checker.check_url(url, resolved_url=resolved, resolve_error=error)
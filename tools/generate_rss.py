@@ -16,6 +16,9 @@ from pathlib import Path
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom.minidom import parseString
 
+sys.path.insert(0, str(Path(__file__).parent))
+from artifact_writer import write_if_changed  # noqa: E402
+
 
 def extract_articles(news_html: str) -> list:
     """Extract article data from news.html card-link elements."""
@@ -146,9 +149,10 @@ def main():
         return 1
 
     rss_xml = build_rss(articles)
-    feed_path.write_text(rss_xml, encoding="utf-8")
-
-    print(f"Generated {feed_path.name} with {min(len(articles), 50)} articles")
+    if write_if_changed(feed_path, rss_xml):
+        print(f"Generated {feed_path.name} with {min(len(articles), 50)} articles")
+    else:
+        print(f"No changes: {feed_path.name} already has {min(len(articles), 50)} articles")
     return 0
 
 
@@ -9,6 +9,7 @@ Usage:
     python3 tools/normalize_urls.py              # Dry-run (default)
     python3 tools/normalize_urls.py --apply       # Apply changes
     python3 tools/normalize_urls.py --skip-resolve # Only strip params + HTTPS upgrade
+    python3 tools/normalize_urls.py --refresh      # Ignore cached redirect lookups
 """
 
 import argparse
@@ -17,8 +18,12 @@ from pathlib import Path
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 sys.path.insert(0, str(Path(__file__).parent))
-from check_url_safety import resolve_urls_concurrent, SHORTENER_DOMAINS
+from check_url_safety import (
+    resolve_urls_concurrent, DomainIndex, SHORTENER_DOMAINS, PER_HOST_CONCURRENCY,
+    HOST_DELAY,
+)
 from check_all_site_urls import extract_urls_from_html
+from artifact_writer import atomic_write
 
 # --- Constants -----------------------------------------------------------
 
@@ -65,6 +70,10 @@ BOT_BLOCKED_DOMAINS = [
 # Extend shortener list with Amazon short links
 SHORTENER_DOMAINS_EXT = list(SHORTENER_DOMAINS) + ['a.co']
 
+# Matched on label boundaries, with subdomains (see check_url_safety.DomainIndex)
+BOT_BLOCKED_INDEX = DomainIndex(BOT_BLOCKED_DOMAINS)
+SHORTENER_INDEX_EXT = DomainIndex(SHORTENER_DOMAINS_EXT)
+
 # --- Utility functions ---------------------------------------------------
 
 
@@ -115,9 +124,7 @@ def _is_private_ip(host):
 def is_shortener(url):
     """Check if URL is from a known shortener domain."""
     try:
-        domain = urlparse(url).netloc.lower()
-        return any(domain == sd or domain.endswith('.' + sd)
-                   for sd in SHORTENER_DOMAINS_EXT)
+        return urlparse(url).netloc in SHORTENER_INDEX_EXT
     except Exception:
         return False
 
@@ -177,7 +184,8 @@ def collect_all_urls():
 
 
 def build_replacement_map(all_unique, skip_resolve=False, timeout=10,
-                          workers=10):
+                          workers=10, per_host=PER_HOST_CONCURRENCY,
+                          host_delay=HOST_DELAY, refresh=False):
     """Build {original_url: final_url} for all URLs that need changing."""
     replacements = {}  # original -> final
     categories = {
@@ -214,7 +222,10 @@ def build_replacement_map(all_unique, skip_resolve=False, timeout=10,
             urls_to_resolve,
             max_workers=workers,
             timeout=timeout,
-            skip_domains=BOT_BLOCKED_DOMAINS,
+            skip_domains=BOT_BLOCKED_INDEX,
+            per_host=per_host,
+            host_delay=host_delay,
+            refresh=refresh,
         )
 
         for original_url in all_unique:
@@ -232,8 +243,7 @@ def build_replacement_map(all_unique, skip_resolve=False, timeout=10,
 
             # Check if the domain was bot-blocked (resolved == cleaned means skipped)
             try:
-                domain = urlparse(cleaned_url).netloc.lower()
-                if any(bd in domain for bd in BOT_BLOCKED_DOMAINS):
+                if urlparse(cleaned_url).netloc in BOT_BLOCKED_INDEX:
                     categories['skipped_bot_blocked'].append(original_url)
                     if cleaned_url != original_url:
                         replacements[original_url] = cleaned_url
@@ -278,7 +288,7 @@ def apply_to_file(filepath, replacements, dry_run=True):
     if content != original_content:
         count = sum(1 for old in replacements if old in original_content)
         if not dry_run:
-            filepath.write_text(content, encoding='utf-8')
+            atomic_write(filepath, content)
 
     return count
 
@@ -362,6 +372,14 @@ def main():
                         help='HTTP timeout per URL in seconds (default: 10)')
     parser.add_argument('--workers', type=int, default=10,
                         help='Concurrent resolution workers (default: 10)')
+    parser.add_argument('--per-host', type=int, default=PER_HOST_CONCURRENCY,
+                        help='Concurrent requests per host '
+                             f'(default: {PER_HOST_CONCURRENCY})')
+    parser.add_argument('--host-delay', type=float, default=HOST_DELAY,
+                        help='Seconds between requests to the same host '
+                             f'(default: {HOST_DELAY})')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Resolve every URL again instead of using cached lookups')
     args = parser.parse_args()
 
     dry_run = not args.apply
@@ -379,6 +397,9 @@ def main():
         skip_resolve=args.skip_resolve,
         timeout=args.timeout,
         workers=args.workers,
+        per_host=args.per_host,
+        host_delay=args.host_delay,
+        refresh=args.refresh,
     )
 
     # Apply to each file
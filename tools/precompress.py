@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Pre-compressor for CSOH Site
+
+Writes maximum-compression .gz (and .br, when the ``brotli`` module is
+installed) siblings next to every text file the site serves, so nginx
+(``gzip_static``) and Apache (the rewrite rules in .htaccess) send the
+stored copy instead of compressing the file again on every request.
+
+Run it after update_sri.py and anything else that rewrites HTML, right
+before deploying. A file whose content hash matches the manifest from the
+last run is not compressed again, and the rest are compressed in a pool
+of worker processes.
+
+Usage:
+    python3 tools/precompress.py              # Compress new and changed files
+    python3 tools/precompress.py --full       # Ignore the manifest
+    python3 tools/precompress.py --jobs 4     # Limit the worker processes
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from artifact_writer import ArtifactWriter, atomic_write, file_hash
+
+try:
+    import brotli  # optional: adds .br siblings next to the .gz ones
+except ImportError:
+    brotli = None
+
+# --- Constants -----------------------------------------------------------
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = Path('.cache') / 'precompress-manifest.json'
+
+# Text files the site serves. JSON is limited to the files nginx and
+# .htaccess expose; every other .json is denied and must not gain a
+# sibling that the rewrite rules would serve instead.
+TEXT_EXTENSIONS = {'.html', '.css', '.js', '.xml', '.svg', '.txt'}
+PUBLIC_JSON = re.compile(r'^(preview-mapping\.json|feed\.json|news-archive/(index|shard-[0-9]+)\.json)$')
+
+# Never served (deploy and the Docker image drop them)
+SKIP_DIRS = {'tools', 'node_modules', '__pycache__'}
+
+# Matches nginx's gzip_min_length: smaller files aren't worth a sibling
+MIN_SIZE = 256
+
+SUFFIXES = ('.gz', '.br')
+
+
+def is_servable(rel_path: str) -> bool:
+    """Whether the file at ``rel_path`` (POSIX, repo-relative) gets siblings."""
+    ext = os.path.splitext(rel_path)[1].lower()
+    if ext == '.json':
+        return bool(PUBLIC_JSON.match(rel_path))
+    return ext in TEXT_EXTENSIONS
+
+
+def find_text_files(repo_root: Path) -> List[str]:
+    """Repo-relative paths of every servable text file, skipping hidden directories."""
+    found = []
+    for directory, dirs, files in os.walk(repo_root):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS]
+        for name in files:
+            rel_path = (Path(directory) / name).relative_to(repo_root).as_posix()
+            if not name.startswith('.') and is_servable(rel_path):
+                found.append(rel_path)
+    return sorted(found)
+
+
+def find_orphans(repo_root: Path, sources: List[str]) -> List[Path]:
+    """Siblings whose source file is gone (or no longer servable)."""
+    keep = set(sources)
+    orphans = []
+    for directory, dirs, files in os.walk(repo_root):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS]
+        for name in files:
+            stem, suffix = os.path.splitext(name)
+            if suffix not in SUFFIXES or os.path.splitext(stem)[1].lower() not in TEXT_EXTENSIONS | {'.json'}:
+                continue
+            source = (Path(directory) / stem).relative_to(repo_root).as_posix()
+            if source not in keep:
+                orphans.append(Path(directory) / name)
+    return sorted(orphans)
+
+
+def compress(path: str) -> Dict[str, Optional[bytes]]:
+    """Compress one file at maximum level; runs in a worker process.
+
+    Maps each suffix to the compressed bytes, or None when that variant
+    should not exist (file too small, no gain, or brotli unavailable).
+    """
+    data = Path(path).read_bytes()
+    variants: Dict[str, Optional[bytes]] = dict.fromkeys(SUFFIXES)
+    if len(data) < MIN_SIZE:
+        return variants
+    # mtime=0 keeps the output byte-identical across runs
+    variants['.gz'] = gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return {suffix: blob if blob is not None and len(blob) < len(data) else None
+            for suffix, blob in variants.items()}
+
+
+class Manifest:
+    """Content hash and written variants of each file from the last run."""
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.files: Dict[str, Dict] = {}
+
+    def load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self.files = data.get('files', {})
+
+    def save(self) -> None:
+        data = {'version': self.VERSION, 'files': self.files}
+        atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+    def is_current(self, rel_path: str, digest: str, path: Path) -> bool:
+        """True if ``rel_path`` had this hash last run and its siblings are still there.
+
+        A run without brotli never counts a file whose .br was expected as
+        current, and vice versa, so the set of siblings always matches.
+        """
+        entry = self.files.get(rel_path)
+        if not entry or entry['sha256'] != digest or entry['brotli'] != (brotli is not None):
+            return False
+        return all(Path(f'{path}{suffix}').exists() for suffix in entry['variants'])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Write pre-compressed .gz/.br siblings of text files')
+    parser.add_argument('--root', type=Path, default=REPO_ROOT,
+                        help='Site directory to compress (default: repository root)')
+    parser.add_argument('--manifest', type=Path, default=None,
+                        help=f'Where content hashes are remembered between runs (default: <root>/{MANIFEST_PATH})')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the manifest and compress every file')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes (default: one per CPU)')
+    args = parser.parse_args(argv)
+
+    repo_root = args.root.resolve()
+    manifest = Manifest(args.manifest or repo_root / MANIFEST_PATH)
+    if not args.full:
+        manifest.load()
+
+    if brotli is None:
+        print("Note: brotli module not installed; writing .gz only (pip install brotli)")
+
+    sources = find_text_files(repo_root)
+    print(f"Checking {len(sources)} text files...")
+
+    files: Dict[str, Dict] = {}
+    pending: List[Tuple[str, str]] = []
+    for rel_path in sources:
+        path = repo_root / rel_path
+        digest = file_hash(path)
+        if digest is None:
+            continue
+        if manifest.is_current(rel_path, digest, path):
+            files[rel_path] = manifest.files[rel_path]
+        else:
+            pending.append((rel_path, digest))
+
+    writer = ArtifactWriter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            paths = [str(repo_root / rel_path) for rel_path, _ in pending]
+            for (rel_path, digest), variants in zip(pending, pool.map(compress, paths, chunksize=4)):
+                written = []
+                for suffix, blob in variants.items():
+                    target = repo_root / f'{rel_path}{suffix}'
+                    if blob is None:
+                        writer.remove(target)
+                    else:
+                        writer.write(target, blob)
+                        written.append(suffix)
+                files[rel_path] = {'sha256': digest, 'brotli': brotli is not None, 'variants': written}
+
+    for orphan in find_orphans(repo_root, sources):
+        writer.remove(orphan)
+
+    for path in writer.changed:
+        print(f"  ✓ Wrote: {Path(path).relative_to(repo_root)}")
+    for path in writer.removed:
+        print(f"  ✗ Removed: {Path(path).relative_to(repo_root)}")
+
+    manifest.files = files
+    manifest.save()
+
+    skipped = len(files) - len(pending)
+    print(f"\n✓ Done! Compressed {len(pending)} files ({writer.summary()}), "
+          f"skipped {skipped} unchanged.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
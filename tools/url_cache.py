@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk cache of URL redirect resolutions
+
+check_all_site_urls.py, normalize_urls.py, check_existing_urls.py and
+submit_resource.py (through check_url_safety.resolve_urls_concurrent) and
+update_news.py all follow the same links to their final destination. They
+share one SQLite file, so a link resolved by any of them is not requested
+again until its entry expires:
+- Successful lookups are trusted for ``ttl`` seconds (30 days by default)
+  and are shared by every tool
+- Failed lookups are remembered for the shorter ``failure_ttl`` (1 day), so
+  a flaky host is retried soon but not on every run. Each tool only sees
+  its own failures (rows are tagged with a ``resolver`` name): a HEAD
+  request with a bot User-Agent can fail where a browser-like GET works
+
+Usage:
+    from url_cache import ResolutionCache
+
+    cache = ResolutionCache("check_url_safety")
+    entry = cache.lookup(url)            # Resolution or None if unknown/expired
+    cache.record(url, final, status=200)
+    cache.save()
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Union
+
+# --- Constants -----------------------------------------------------------
+
+# Lives with the rest of the run-to-run state; not served, not committed
+CACHE_PATH = Path(__file__).resolve().parent.parent / '.cache' / 'url-resolutions.sqlite3'
+
+SUCCESS_TTL = 30 * 24 * 3600
+FAILURE_TTL = 24 * 3600
+
+# SQLite's default limit on host parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+class Resolution(NamedTuple):
+    final: str                # final URL (the original URL if the lookup failed)
+    status: Optional[int]     # HTTP status of the last response, if there was one
+    error: Optional[str]      # why the lookup failed, None on success
+    checked: int              # Unix time of the lookup
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ResolutionCache:
+    """SQLite map of URL -> Resolution with separate success and failure TTLs.
+
+    ``resolver`` names the tool (and so the request method) using the
+    cache. Lookups see every tool's successes but only this resolver's
+    failures. Safe to share between threads; writes are committed by save().
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS resolutions (
+            url TEXT NOT NULL,
+            resolver TEXT NOT NULL,
+            final TEXT NOT NULL,
+            status INTEGER,
+            error TEXT,
+            checked INTEGER NOT NULL,
+            PRIMARY KEY (url, resolver)
+        );
+    """
+
+    def __init__(self, resolver: str, path: Union[str, os.PathLike] = CACHE_PATH,
+                 ttl: int = SUCCESS_TTL, failure_ttl: int = FAILURE_TTL):
+        self.resolver = resolver
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        # Several processes may use the file one after another (and a
+        # daemon may hold it open), so wait for a writer instead of failing
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(resolutions)")}
+        if columns and "resolver" not in columns:
+            # Written before rows were tagged; whose failures they are is unknown
+            self.conn.execute("DROP TABLE resolutions")
+        self.conn.executescript(self.SCHEMA)
+        self.conn.commit()
+
+    def _fresh(self, error: Optional[str], checked: int, now: float) -> bool:
+        ttl = self.ttl if error is None else self.failure_ttl
+        return now - checked < ttl
+
+    def lookup(self, url: str) -> Optional[Resolution]:
+        """Return the cached resolution of ``url``, or None if unknown or expired."""
+        return self.lookup_many([url]).get(url)
+
+    def lookup_many(self, urls: Iterable[str]) -> Dict[str, Resolution]:
+        """Fresh cached resolutions of ``urls``; unknown and expired URLs are left out.
+
+        The newest fresh row wins (a success on a tie): any resolver's
+        success, or a failure this resolver recorded itself.
+        """
+        urls = list(dict.fromkeys(urls))
+        now = time.time()
+        found: Dict[str, Resolution] = {}
+        with self._lock:
+            for start in range(0, len(urls), _LOOKUP_CHUNK):
+                chunk = urls[start:start + _LOOKUP_CHUNK]
+                rows = self.conn.execute(
+                    "SELECT url, final, status, error, checked FROM resolutions"
+                    f" WHERE url IN ({','.join('?' * len(chunk))})"
+                    " AND (error IS NULL OR resolver = ?)",
+                    chunk + [self.resolver],
+                )
+                for url, final, status, error, checked in rows:
+                    if not self._fresh(error, checked, now):
+                        continue
+                    entry = Resolution(final, status, error, checked)
+                    # Newest first; on a tie the success wins
+                    if url not in found or (checked, entry.ok) > (found[url].checked, found[url].ok):
+                        found[url] = entry
+        return found
+
+    def record(self, url: str, final: Optional[str], status: Optional[int] = None,
+               error: Optional[str] = None) -> None:
+        """Remember the outcome of resolving ``url`` (pass ``error`` for a failure)."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO resolutions (url, resolver, final, status, error, checked)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (url, self.resolver, final or url, status, error, int(time.time())),
+            )
+
+    def save(self) -> None:
+        """Drop expired entries and commit."""
+        now = int(time.time())
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM resolutions WHERE checked <= ? - CASE WHEN error IS NULL"
+                " THEN ? ELSE ? END",
+                (now, self.ttl, self.failure_ttl),
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM resolutions").fetchone()[0]
@@ -8,14 +8,37 @@
 """
 
 import argparse
+import contextlib
 import datetime as dt
+import hashlib
 import html
+import http.client
+import json
+import math
+import os
 import re
+import signal
+import sqlite3
+import ssl
+import statistics
 import sys
-import urllib.request
+import threading
+import time
 import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from email.utils import format_datetime, parsedate_to_datetime
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlparse
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import brotli  # optional: lets servers send Brotli-compressed feeds
+except ImportError:
+    brotli = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools"))
+from artifact_writer import ArtifactWriter, atomic_write  # noqa: E402
+from url_cache import ResolutionCache  # noqa: E402
 
 
 FEEDS = [
@@ -55,6 +78,86 @@ FEEDS = [
     {"name": "FortiGuard Labs", "url": "https://filestore.fortinet.com/fortiguard/rss/threatsignal.xml"},
 ]
 
+# Fetch concurrency: total in-flight requests, and in-flight requests per host
+# (several feeds share a host, e.g. the three CISA feeds).
+FETCH_WORKERS = 8
+FETCH_PER_HOST = 2
+
+# Responses larger than this (compressed or not) are abandoned; no feed or
+# redirect hop needs more.
+MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+MAX_REDIRECTS = 10
+USER_AGENT = "Mozilla/5.0 (CSOH News Bot; +https://csoh.org)"
+
+# Run-to-run state (feed validators, parsed items) lives here; it is not
+# served and is not committed.
+CACHE_DIR = ".cache"
+FEED_CACHE_NAME = "feed-cache.json"
+# Shared with the URL checkers in tools/ (tools/url_cache.py). They reuse our
+# successful lookups but not our failures, since a HEAD request with the bot
+# User-Agent is refused by hosts that their browser-like GET gets through.
+RESOLVE_CACHE_NAME = "url-resolutions.sqlite3"
+RESOLVER_NAME = "update_news"
+
+# Every article ever published to news.html; the page and feed.xml are
+# rendered from it. Seeded from news.html itself when missing.
+ARTICLE_DB = os.path.join(CACHE_DIR, "news.sqlite3")
+
+# Only the newest items of each feed are read, and summaries are cut down to
+# what the cards and feed.xml can show (tooltips use up to 400 characters).
+FEED_ITEM_LIMIT = 50
+SUMMARY_MAX_CHARS = 500
+
+# How long a resolved redirect is trusted, and how long a failed lookup is
+# remembered before we try the HEAD request again.
+RESOLVE_TTL = 30 * 24 * 3600
+RESOLVE_FAILURE_TTL = 24 * 3600
+
+# Adaptive polling: each feed is polled about twice per typical gap between
+# its posts, clamped to [POLL_MIN_INTERVAL, POLL_MAX_INTERVAL]. Feeds that
+# keep failing back off exponentially up to the maximum. A feed due within
+# POLL_GRACE of a run is polled in that run rather than waiting for the next.
+POLL_MIN_INTERVAL = 30 * 60
+POLL_MAX_INTERVAL = 24 * 3600
+POLL_GRACE = 10 * 60
+
+# Relevance scoring: candidates are compared (TF-IDF cosine) with the centroid
+# of the newest RELEVANCE_REFERENCE_SIZE stored articles. Those scoring below
+# RELEVANCE_MIN_SCORE share almost no vocabulary with past coverage and are
+# dropped. The page shows the best of the newest 2 x --max-articles stories,
+# ranked by score halved every RELEVANCE_HALF_LIFE_HOURS of age. Scoring
+# starts once the store holds RELEVANCE_MIN_REFERENCE articles.
+RELEVANCE_MIN_SCORE = 0.02
+RELEVANCE_HALF_LIFE_HOURS = 24
+RELEVANCE_REFERENCE_SIZE = 2000
+RELEVANCE_MIN_REFERENCE = 50
+
+# How often --daemon mode wakes up; the poll schedule decides which feeds
+# are actually fetched.
+DAEMON_INTERVAL = 15 * 60
+
+# Paginated archive: every stored story, oldest first, in JSON shards of
+# ARCHIVE_SHARD_SIZE stories next to an index.json. news.html only carries
+# the newest --page-articles cards; main.js pulls older shards on scroll.
+# Shards are filled oldest first, so a run normally rewrites only the last
+# one or two.
+ARCHIVE_DIR = "news-archive"
+ARCHIVE_SHARD_SIZE = 50
+
+# Rendered card/feed views kept in memory, keyed by entry content hash.
+# Large enough for the whole archive of a year or two of stories.
+VIEW_CACHE_SIZE = 50000
+
+# Near-duplicate stories: articles published within CLUSTER_WINDOW_DAYS of
+# each other whose title/summary words overlap by at least CLUSTER_SIMILARITY
+# (Jaccard) share one card. Candidates are found through MinHash signatures
+# split into bands of MINHASH_BAND_ROWS values, so each lookup only touches
+# articles that agree on a whole band.
+CLUSTER_SIMILARITY = 0.35
+CLUSTER_WINDOW_DAYS = 3
+MINHASH_PERMUTATIONS = 32
+MINHASH_BAND_ROWS = 2
+
 KEYWORDS = {
     "cloud", "aws", "azure", "gcp", "google cloud", "kubernetes", "k8s",
     "iam", "identity", "zero trust", "container", "supply chain",
@@ -92,19 +195,359 @@ TAG_KEYWORDS = {
 }
 
 
-def fetch_feed(url: str, timeout: int = 15) -> Optional[str]:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (CSOH News Bot; +https://csoh.org)",
-            "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
-        },
-    )
+class RunStats:
+    """Per-feed measurements, counters and stage timings for one run.
+
+    Filled in as the run goes (fetches happen on worker threads, so updates
+    are locked) and reported with ``--stats``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.feeds: Dict[str, Dict] = {}
+            self.counters: Dict[str, int] = {}
+            self.stages: Dict[str, float] = {}
+
+    def feed(self, name: str, **fields) -> None:
+        """Set fields on a feed's row (e.g. status, seconds, bytes)."""
+        with self._lock:
+            self.feeds.setdefault(name, {}).update(fields)
+
+    def feed_count(self, name: str, key: str, n: int = 1) -> None:
+        with self._lock:
+            row = self.feeds.setdefault(name, {})
+            row[key] = row.get(key, 0) + n
+
+    def count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time a block; repeated blocks with the same name add up."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            return {
+                "stages": {name: round(sec, 4) for name, sec in self.stages.items()},
+                "counters": dict(sorted(self.counters.items())),
+                "feeds": {name: dict(row) for name, row in self.feeds.items()},
+            }
+
+    def format_table(self) -> str:
+        data = self.as_dict()
+        lines = ["Stages:"]
+        for name, sec in data["stages"].items():
+            lines.append(f"  {name:<14}{sec:>9.3f}s")
+        lines.append("Counters:")
+        for name, value in data["counters"].items():
+            lines.append(f"  {name:<22}{value:>7}")
+        columns = ("status", "seconds", "bytes", "items", "irrelevant", "duplicate", "added")
+        lines.append("Feeds (slowest first):")
+        lines.append(f"  {'feed':<30}" + "".join(f"{c:>11}" for c in columns))
+        rows = sorted(data["feeds"].items(), key=lambda kv: kv[1].get("seconds", 0), reverse=True)
+        for name, row in rows:
+            cells = []
+            for column in columns:
+                value = row.get(column, "")
+                cells.append(f"{value:>11.3f}" if isinstance(value, float) else f"{value!s:>11}")
+            lines.append(f"  {name[:29]:<30}" + "".join(cells))
+        return "\n".join(lines)
+
+
+STATS = RunStats()
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+class ResponseTooLarge(Exception):
+    pass
+
+
+class HttpClient:
+    """Small keep-alive HTTP client shared by feed fetches and redirect lookups.
+
+    Idle connections are pooled per (scheme, host), so feeds and article
+    links on the same host reuse one TLS session. Responses are requested
+    with gzip/deflate (and br when the ``brotli`` module is installed),
+    decoded transparently and capped at ``max_bytes``. Redirects are
+    followed by hand for GET and HEAD alike.
+    """
+
+    def __init__(self, max_bytes: int = MAX_RESPONSE_BYTES, max_idle_per_host: int = FETCH_PER_HOST):
+        self.max_bytes = max_bytes
+        self.max_idle_per_host = max_idle_per_host
+        self.accept_encoding = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+        self._ssl_context = ssl.create_default_context()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _checkout(self, scheme: str, host: str, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            conns = self._idle.get((scheme, host))
+            if conns:
+                conn = conns.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        STATS.count("http_connections")
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=timeout, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, timeout=timeout), False
+
+    def _checkin(self, scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault((scheme, host), [])
+            if len(conns) < self.max_idle_per_host:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def _read_body(self, resp: http.client.HTTPResponse) -> bytes:
+        length = resp.getheader("Content-Length")
+        if length and length.isdigit() and int(length) > self.max_bytes:
+            raise ResponseTooLarge(f"{length} bytes")
+        raw = resp.read(self.max_bytes + 1)
+        if len(raw) > self.max_bytes:
+            raise ResponseTooLarge(f"over {self.max_bytes} bytes")
+        STATS.count("http_bytes_received", len(raw))
+        encoding = (resp.getheader("Content-Encoding") or "").strip().lower()
+        if encoding in ("gzip", "x-gzip"):
+            return self._inflate(raw, zlib.decompressobj(16 + zlib.MAX_WBITS))
+        if encoding == "deflate":
+            try:
+                return self._inflate(raw, zlib.decompressobj())
+            except zlib.error:  # some servers send raw deflate without the zlib header
+                return self._inflate(raw, zlib.decompressobj(-zlib.MAX_WBITS))
+        if encoding == "br" and brotli is not None:
+            body = brotli.decompress(raw)
+            if len(body) > self.max_bytes:
+                raise ResponseTooLarge(f"over {self.max_bytes} bytes decoded")
+            return body
+        return raw
+
+    def _inflate(self, raw: bytes, decoder) -> bytes:
+        body = decoder.decompress(raw, self.max_bytes + 1)
+        if len(body) > self.max_bytes:
+            raise ResponseTooLarge(f"over {self.max_bytes} bytes decoded")
+        return body
+
+    def _send(self, method: str, url: str, headers: Dict[str, str], timeout: float) -> HttpResponse:
+        parts = urlparse(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"unsupported URL: {url}")
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = dict(headers, **{"Accept-Encoding": self.accept_encoding})
+        headers.setdefault("User-Agent", USER_AGENT)
+        while True:
+            conn, reused = self._checkout(scheme, parts.netloc, timeout)
+            try:
+                conn.request(method, path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read() if method == "HEAD" else self._read_body(resp)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:  # the server closed an idle connection; retry once on a fresh one
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if reused:
+                STATS.count("http_connections_reused")
+            if resp.will_close or not resp.isclosed():
+                conn.close()
+            else:
+                self._checkin(scheme, parts.netloc, conn)
+            return HttpResponse(resp.status, url, {k.lower(): v for k, v in resp.getheaders()}, body)
+
+    def request(
+        self, method: str, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 15
+    ) -> HttpResponse:
+        """Send a request, following up to MAX_REDIRECTS redirects.
+
+        The returned ``url`` is the final one. Network errors and oversized
+        responses raise; HTTP error statuses are returned as they are.
+        """
+        headers = dict(headers or {})
+        for _ in range(MAX_REDIRECTS + 1):
+            resp = self._send(method, url, headers, timeout)
+            location = resp.headers.get("location")
+            if resp.status not in (301, 302, 303, 307, 308) or not location:
+                return resp
+            url = urljoin(url, location)
+            if resp.status == 303 and method != "HEAD":
+                method = "GET"
+        raise http.client.HTTPException(f"too many redirects: {url}")
+
+
+HTTP = HttpClient()
+
+
+def fetch_feed(
+    url: str,
+    timeout: int = 15,
+    etag: str = "",
+    last_modified: str = "",
+    client: Optional[HttpClient] = None,
+) -> Tuple[int, Optional[str], Dict[str, str]]:
+    """Fetch a feed, optionally as a conditional GET.
+
+    Returns ``(status, body, validators)``. ``status`` is 200 with the body on
+    success, 304 with no body when the cached copy is still current, and 0 on
+    any failure (including a body over the client's ``max_bytes``).
+    ``validators`` carries the response's ETag/Last-Modified. ``client``
+    defaults to the shared ``HTTP`` client.
+    """
+    headers = {
+        "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+        resp = (client or HTTP).request("GET", url, headers=headers, timeout=timeout)
     except Exception:
-        return None
+        return 0, None, {}
+    if resp.status == 304:
+        return 304, None, _validators(resp.headers)
+    if resp.status != 200:
+        return 0, None, {}
+    return 200, resp.body.decode("utf-8", errors="replace"), _validators(resp.headers)
+
+
+def _validators(headers) -> Dict[str, str]:
+    validators = {}
+    if headers.get("etag"):
+        validators["etag"] = headers["etag"]
+    if headers.get("last-modified"):
+        validators["last_modified"] = headers["last-modified"]
+    return validators
+
+
+def fetch_feeds(
+    feeds: Sequence[Dict[str, str]],
+    max_workers: int = FETCH_WORKERS,
+    per_host: int = FETCH_PER_HOST,
+    timeout: int = 15,
+    cache: Optional["FeedCache"] = None,
+    client: Optional[HttpClient] = None,
+) -> List[Tuple[int, Optional[str], Dict[str, str]]]:
+    """Fetch all feeds concurrently and return their results in input order.
+
+    At most ``max_workers`` requests run at once, and at most ``per_host``
+    of those go to the same host. Results line up with ``feeds`` regardless
+    of completion order, so downstream merging stays deterministic. When a
+    ``cache`` is given, its stored validators are sent so unchanged feeds
+    come back as 304. ``client`` is passed on to fetch_feed (the benchmark
+    uses one with a larger ``max_bytes`` for its synthetic feed).
+    """
+    host_limits: Dict[str, threading.Semaphore] = {}
+    for feed in feeds:
+        host = urlparse(feed["url"]).netloc.lower()
+        host_limits.setdefault(host, threading.BoundedSemaphore(max(1, per_host)))
+
+    def fetch_one(feed: Dict[str, str]) -> Tuple[int, Optional[str], Dict[str, str]]:
+        cached = cache.get(feed["url"]) if cache is not None else None
+        etag = cached.get("etag", "") if cached else ""
+        last_modified = cached.get("last_modified", "") if cached else ""
+        with host_limits[urlparse(feed["url"]).netloc.lower()]:
+            start = time.perf_counter()
+            result = fetch_feed(feed["url"], timeout=timeout, etag=etag, last_modified=last_modified,
+                                client=client)
+        status, body, _ = result
+        STATS.feed(
+            feed["name"],
+            status=status or "error",
+            seconds=round(time.perf_counter() - start, 3),
+            bytes=len(body.encode("utf-8")) if body else 0,
+        )
+        return result
+
+    if not feeds:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(fetch_one, feeds))
+
+
+def load_json(path: str) -> Dict:
+    """Load a JSON object from ``path``; missing or corrupt files give ``{}``."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json(path: str, data: Dict) -> None:
+    """Write ``data`` as JSON atomically."""
+    atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True))
+
+
+class FeedCache:
+    """On-disk cache of feed validators and parsed items, keyed by feed URL.
+
+    Lets a run send ``If-None-Match``/``If-Modified-Since`` and reuse the
+    previously parsed items when a feed answers 304 Not Modified.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict] = load_json(path)
+        self.dirty = False
+
+    def get(self, url: str) -> Optional[Dict]:
+        entry = self.entries.get(url)
+        return entry if isinstance(entry, dict) else None
+
+    def items(self, url: str) -> Optional[List[Dict[str, str]]]:
+        entry = self.get(url)
+        if entry is None or not isinstance(entry.get("items"), list):
+            return None
+        return [dict(item) for item in entry["items"]]
+
+    def store(self, url: str, validators: Dict[str, str], items: List[Dict[str, str]]) -> None:
+        if not validators:
+            # Nothing to revalidate with next time; don't keep stale items around.
+            if self.entries.pop(url, None) is not None:
+                self.dirty = True
+            return
+        self.entries[url] = dict(validators, items=[dict(item) for item in items])
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.dirty:
+            save_json(self.path, self.entries)
+            self.dirty = False
 
 
 def strip_html(text: str) -> str:
@@ -139,35 +582,76 @@ def parse_date(value: str) -> Optional[dt.datetime]:
     return None
 
 
-def _word_match(keyword: str, text: str) -> bool:
-    """Match keyword in text using word boundaries for short keywords."""
-    if len(keyword) <= 3:
-        return bool(re.search(r'\b' + re.escape(keyword) + r'\b', text))
-    return keyword in text
+class Classification(NamedTuple):
+    relevant: bool
+    category: str
+    tags: List[str]
+
+
+class KeywordClassifier:
+    """Match every keyword table against a text at once.
+
+    Built once at import. Keywords of three characters or fewer only count as
+    whole words (so "ai" does not fire inside "email"), so they are looked up
+    in the set of words found by a single tokenizing pass; longer keywords
+    match anywhere in the text and are checked with a substring search.
+    Each distinct keyword is tested once per text, and relevance, category
+    and tags are all derived from that one set of hits.
+    """
+
+    _WORD_RE = re.compile(r"\w+")
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        category_keywords: Dict[str, List[str]],
+        tag_keywords: Dict[str, List[str]],
+    ):
+        self.keywords = frozenset(k.lower() for k in keywords)
+        self.categories = [(name, frozenset(k.lower() for k in keys)) for name, keys in category_keywords.items()]
+        self.tags = [(name, frozenset(k.lower() for k in keys)) for name, keys in tag_keywords.items()]
+
+        vocabulary = set(self.keywords)
+        for _, keys in self.categories + self.tags:
+            vocabulary |= keys
+        short = {k for k in vocabulary if len(k) <= 3}
+        self._short_words = frozenset(k for k in short if self._WORD_RE.fullmatch(k))
+        # Short keywords with punctuation can't be found by tokenizing; give
+        # them a precompiled whole-word pattern instead.
+        self._short_patterns = [
+            (k, re.compile(r"\b" + re.escape(k) + r"\b")) for k in sorted(short - self._short_words)
+        ]
+        self._substrings = tuple(sorted(vocabulary - short))
+
+    def matches(self, text: str) -> set:
+        """Return the set of keywords found in ``text`` (which is lower-cased here)."""
+        lower = text.lower()
+        found = {kw for kw in self._substrings if kw in lower}
+        found.update(self._short_words.intersection(self._WORD_RE.findall(lower)))
+        found.update(kw for kw, pattern in self._short_patterns if pattern.search(lower))
+        return found
+
+    def classify(self, text: str) -> Classification:
+        """Relevance, category and tags for ``text`` from one set of keyword hits."""
+        found = self.matches(text)
+        category = next((name for name, keys in self.categories if not found.isdisjoint(keys)), "report")
+        tags = [name for name, keys in self.tags if not found.isdisjoint(keys)] or ["Cloud Security"]
+        return Classification(not found.isdisjoint(self.keywords), category, tags[:3])
+
+
+CLASSIFIER = KeywordClassifier(KEYWORDS, CATEGORY_KEYWORDS, TAG_KEYWORDS)
 
 
 def is_relevant(text: str) -> bool:
-    lower = text.lower()
-    return any(_word_match(kw, lower) for kw in KEYWORDS)
+    return CLASSIFIER.classify(text).relevant
 
 
 def classify_category(text: str) -> str:
-    lower = text.lower()
-    for category, keys in CATEGORY_KEYWORDS.items():
-        if any(_word_match(k, lower) for k in keys):
-            return category
-    return "report"
+    return CLASSIFIER.classify(text).category
 
 
 def build_tags(text: str) -> List[str]:
-    lower = text.lower()
-    tags: List[str] = []
-    for tag, keys in TAG_KEYWORDS.items():
-        if any(_word_match(k, lower) for k in keys):
-            tags.append(tag)
-    if not tags:
-        tags = ["Cloud Security"]
-    return tags[:3]
+    return CLASSIFIER.classify(text).tags
 
 
 def normalize_url(url: str) -> str:
@@ -176,85 +660,159 @@ def normalize_url(url: str) -> str:
     return url.rstrip("/")
 
 
-def resolve_url(url: str, timeout: int = 10) -> str:
-    """Follow redirects and return the final destination URL."""
-    req = urllib.request.Request(
-        url,
-        method="HEAD",
-        headers={
-            "User-Agent": "Mozilla/5.0 (CSOH News Bot; +https://csoh.org)",
-        },
-    )
+class RedirectCache:
+    """Map of article URL -> final URL after redirects.
+
+    Stored in the SQLite resolution cache the tools/ URL checkers use as
+    well, so a link resolved by either is not requested again (failures
+    stay private to each side, see RESOLVER_NAME). Successful
+    resolutions are kept for ``ttl`` seconds; failures are kept for the
+    shorter ``failure_ttl`` so a flaky host is retried soon but not on
+    every run.
+    """
+
+    def __init__(self, path: str, ttl: int = RESOLVE_TTL, failure_ttl: int = RESOLVE_FAILURE_TTL):
+        self.path = path
+        self.cache = ResolutionCache(RESOLVER_NAME, path, ttl, failure_ttl)
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Return the cached final URL, or None if unknown or expired."""
+        entry = self.cache.lookup(url)
+        return entry.final if entry is not None else None
+
+    def record(self, url: str, final: Optional[str], status: Optional[int] = None) -> None:
+        error = None if final is not None else (f"HTTP {status}" if status else "HEAD request failed")
+        self.cache.record(url, final, status, error)
+
+    def save(self) -> None:
+        self.cache.save()
+
+    def close(self) -> None:
+        self.cache.close()
+
+
+def _head_final_url(url: str, timeout: int) -> Tuple[Optional[str], Optional[int]]:
+    """Send a HEAD request and return the URL it ends up at (None on failure) and the status."""
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            final = resp.url
-            if final and final != url:
-                return final
+        resp = HTTP.request("HEAD", url, timeout=timeout)
     except Exception:
-        pass
-    return url
+        return None, None
+    return (resp.url if resp.status < 400 else None), resp.status
+
+
+def resolve_url(url: str, timeout: int = 10, cache: Optional[RedirectCache] = None) -> str:
+    """Follow redirects and return the final destination URL.
+
+    When ``cache`` is given it is consulted first, and the outcome of any
+    network lookup (including a failure) is recorded in it.
+    """
+    if cache is not None:
+        cached = cache.lookup(url)
+        if cached is not None:
+            STATS.count("resolve_cache_hits")
+            return cached
+    STATS.count("resolve_requests")
+    final, status = _head_final_url(url, timeout)
+    if cache is not None:
+        cache.record(url, final, status)
+    return final or url
 
 
 def extract_links(html_text: str) -> List[str]:
     return re.findall(r"href=\"(https?://[^\"]+)\"", html_text, flags=re.IGNORECASE)
 
 
-def parse_rss(xml_text: str, source_name: str) -> List[Dict[str, str]]:
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_PARSE_CHUNK = 64 * 1024
+
+
+def _atom_item(entry: ET.Element, source_name: str) -> Dict[str, str]:
+    title = (entry.findtext(f"{ATOM_NS}title") or "").strip()
+    link = ""
+    for link_el in entry.findall(f"{ATOM_NS}link"):
+        rel = link_el.attrib.get("rel", "alternate")
+        if rel == "alternate":
+            link = link_el.attrib.get("href", "")
+            break
+    published = entry.findtext(f"{ATOM_NS}published") or entry.findtext(f"{ATOM_NS}updated") or ""
+    summary = entry.findtext(f"{ATOM_NS}summary") or entry.findtext(f"{ATOM_NS}content") or ""
+    return {
+        "title": title,
+        "link": link,
+        "published": published,
+        "summary": strip_html(summary)[:SUMMARY_MAX_CHARS],
+        "source": source_name,
+    }
+
+
+def _rss_item(item: ET.Element, source_name: str) -> Dict[str, str]:
+    title = (item.findtext("title") or "").strip()
+    link = (item.findtext("link") or "").strip()
+    published = (item.findtext("pubDate") or item.findtext("date") or "").strip()
+    summary = item.findtext("description") or item.findtext("summary") or ""
+    return {
+        "title": title,
+        "link": link,
+        "published": published,
+        "summary": strip_html(summary)[:SUMMARY_MAX_CHARS],
+        "source": source_name,
+    }
+
+
+def parse_rss(xml_text: str, source_name: str, max_items: int = FEED_ITEM_LIMIT) -> List[Dict[str, str]]:
+    """Stream-parse an RSS or Atom document into at most ``max_items`` items.
+
+    Feeds list their newest items first, so parsing stops as soon as
+    ``max_items`` have been read. Each item is detached from the tree once it
+    has been read and only its title, link, date and a stripped, truncated
+    summary are kept, so memory does not grow with the size of the feed.
+    Items read before a parse error are still returned.
+    """
     items: List[Dict[str, str]] = []
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: List[ET.Element] = []
+    atom: Optional[bool] = None
+    in_item = 0
+
+    def is_item(elem: ET.Element, depth: int) -> bool:
+        if atom:
+            return depth == 1 and elem.tag == f"{ATOM_NS}entry"
+        return elem.tag == "item"
+
+    def handle(events) -> bool:
+        nonlocal atom, in_item
+        for event, elem in events:
+            if event == "start":
+                if atom is None:
+                    atom = elem.tag.lower().endswith("feed")
+                if is_item(elem, len(stack)):
+                    in_item += 1
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if is_item(elem, len(stack)):
+                in_item -= 1
+                items.append((_atom_item if atom else _rss_item)(elem, source_name))
+                if len(items) >= max_items:
+                    return True
+            if in_item == 0 and stack:
+                # Done with this subtree; drop it so the tree stays small.
+                stack[-1].remove(elem)
+        return False
+
     try:
-        root = ET.fromstring(xml_text)
+        for offset in range(0, len(xml_text), _PARSE_CHUNK):
+            parser.feed(xml_text[offset:offset + _PARSE_CHUNK])
+            if handle(parser.read_events()):
+                return items
+        parser.close()
+        handle(parser.read_events())
     except ET.ParseError:
-        return items
-
-    tag = root.tag.lower()
-    if tag.endswith("feed"):
-        ns = "{http://www.w3.org/2005/Atom}"
-        for entry in root.findall(f"{ns}entry"):
-            title = (entry.findtext(f"{ns}title") or "").strip()
-            link = ""
-            for link_el in entry.findall(f"{ns}link"):
-                rel = link_el.attrib.get("rel", "alternate")
-                if rel == "alternate":
-                    link = link_el.attrib.get("href", "")
-                    break
-            published = entry.findtext(f"{ns}published") or entry.findtext(f"{ns}updated") or ""
-            summary = entry.findtext(f"{ns}summary") or entry.findtext(f"{ns}content") or ""
-            items.append({
-                "title": title,
-                "link": link,
-                "published": published,
-                "summary": summary,
-                "source": source_name,
-            })
-        return items
-
-    # RSS
-    for item in root.findall(".//item"):
-        title = (item.findtext("title") or "").strip()
-        link = (item.findtext("link") or "").strip()
-        published = (item.findtext("pubDate") or item.findtext("date") or "").strip()
-        summary = item.findtext("description") or item.findtext("summary") or ""
-        items.append({
-            "title": title,
-            "link": link,
-            "published": published,
-            "summary": summary,
-            "source": source_name,
-        })
+        pass
     return items
 
 
-def load_existing_urls(news_path: str, resources_path: str) -> set:
-    urls = set()
-    for path in (news_path, resources_path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                urls.update(normalize_url(u) for u in extract_links(f.read()))
-        except FileNotFoundError:
-            continue
-    return urls
-
-
 def format_date(d: dt.datetime) -> Tuple[str, str]:
     if d.tzinfo is None:
         d = d.replace(tzinfo=dt.timezone.utc)
@@ -262,67 +820,139 @@ def format_date(d: dt.datetime) -> Tuple[str, str]:
     return d_local.strftime("%B %d, %Y"), d_local.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def build_feed_xml(entries: List[Dict[str, str]], newest_iso: str) -> str:
-    rss = ET.Element("rss", attrib={"version": "2.0", "xmlns:atom": "http://www.w3.org/2005/Atom"})
-    channel = ET.SubElement(rss, "channel")
-
-    ET.SubElement(channel, "title").text = "CSOH - Cloud Security News"
-    ET.SubElement(channel, "link").text = "https://csoh.org/news.html"
-    ET.SubElement(channel, "description").text = (
-        "Latest cloud security news curated by Cloud Security Office Hours. "
-        "Covers AWS, Azure, GCP, Kubernetes vulnerabilities, breaches, and more."
-    )
-    ET.SubElement(channel, "language").text = "en-us"
-    ET.SubElement(channel, "managingEditor").text = "admin@csoh.org (CSOH)"
-    ET.SubElement(channel, "webMaster").text = "admin@csoh.org (CSOH)"
-
-    newest_dt = parse_date(newest_iso) or dt.datetime.now(dt.timezone.utc)
-    ET.SubElement(channel, "lastBuildDate").text = format_datetime(newest_dt)
-    ET.SubElement(channel, "ttl").text = "720"
-
-    ET.SubElement(
-        channel,
-        "atom:link",
-        attrib={
-            "href": "https://csoh.org/feed.xml",
-            "rel": "self",
-            "type": "application/rss+xml",
-        },
+SITE_URL = "https://csoh.org"
+FEED_TITLE = "CSOH - Cloud Security News"
+FEED_DESCRIPTION = (
+    "Latest cloud security news curated by Cloud Security Office Hours. "
+    "Covers AWS, Azure, GCP, Kubernetes vulnerabilities, breaches, and more."
+)
+
+
+def _xml_text(value: str) -> str:
+    """Escape character data exactly like ElementTree does."""
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _xml_attr(value: str) -> str:
+    """Escape an attribute value exactly like ElementTree does."""
+    return (
+        _xml_text(value).replace('"', "&quot;")
+        .replace("\r", "&#13;").replace("\n", "&#10;").replace("\t", "&#09;")
     )
 
-    image = ET.SubElement(channel, "image")
-    ET.SubElement(image, "url").text = "https://csoh.org/favicon.png"
-    ET.SubElement(image, "title").text = "CSOH - Cloud Security News"
-    ET.SubElement(image, "link").text = "https://csoh.org/news.html"
 
-    for entry in entries:
-        title = entry.get("title", "").strip()
-        link = entry.get("link", "").strip()
-        if not title or not link:
-            continue
+def _xml_element(indent: str, tag: str, text: str, attrs: str = "") -> str:
+    if not text:
+        return f"{indent}<{tag}{attrs} />"
+    return f"{indent}<{tag}{attrs}>{_xml_text(text)}</{tag}>"
 
-        item = ET.SubElement(channel, "item")
-        ET.SubElement(item, "title").text = title
-        ET.SubElement(item, "link").text = link
 
-        summary = strip_html(entry.get("summary", ""))
-        if len(summary) > 220:
-            summary = summary[:217].rstrip() + "..."
-        ET.SubElement(item, "description").text = summary
+def tag_slug(tag: str) -> str:
+    """File name stem of a tag's feed, e.g. "Supply Chain" -> "supply-chain"."""
+    return re.sub(r"[^a-z0-9]+", "-", tag.lower()).strip("-")
 
-        source_name = entry.get("source", "Unknown Source")
-        ET.SubElement(item, "source", attrib={"url": link}).text = source_name
-        ET.SubElement(item, "guid", attrib={"isPermaLink": "true"}).text = link
 
-        published_dt = parse_date(entry.get("published", "")) or newest_dt
-        ET.SubElement(item, "pubDate").text = format_datetime(published_dt)
+class FeedWriter:
+    """Builds feed.xml, feed.json and one RSS feed per tag in a single pass.
+
+    Each entry's summary, tags and RSS ``<item>`` come from its cached
+    EntryView; the item is shared by the main feed and every tag feed it
+    belongs to. The RSS text is the same, byte for byte, as
+    ElementTree with ``ET.indent`` would produce.
+    """
+
+    def __init__(self, newest_iso: str, tags: Iterable[str] = TAG_KEYWORDS):
+        self.newest_dt = parse_date(newest_iso) or dt.datetime.now(dt.timezone.utc)
+        self.items: List[str] = []
+        self.json_items: List[Dict] = []
+        self.tag_items: Dict[str, List[str]] = {tag: [] for tag in tags}
+
+    def add(self, entry: Dict[str, str]) -> None:
+        view = VIEWS.get(entry)
+        title, link, summary, tags = view.feed_title, view.feed_link, view.feed_summary, view.feed_tags
+        if not title or not link:
+            return
+
+        source_name = entry.get("source", "Unknown Source")
+        published_dt = view.feed_published or self.newest_dt
+        item = view.rss_item or rss_item(title, link, summary, source_name, published_dt, tags)
 
-        tags = build_tags(f"{title} {summary} {source_name}")
+        self.items.append(item)
         for tag in tags:
-            ET.SubElement(item, "category").text = tag
+            if tag in self.tag_items:
+                self.tag_items[tag].append(item)
+        self.json_items.append({
+            "id": link,
+            "url": link,
+            "title": title,
+            "summary": summary,
+            # JSON Feed 1.1 requires content_text or content_html on every item
+            "content_text": summary or title,
+            "date_published": format_date(published_dt)[1],
+            "authors": [{"name": name} for name in entry.get("sources") or [source_name]],
+            "tags": tags,
+        })
 
-    ET.indent(rss, space="  ")
-    return ET.tostring(rss, encoding="unicode", xml_declaration=True)
+    def _rss(self, items: List[str], title: str, description: str, self_url: str) -> str:
+        ind = " " * 4
+        head = [
+            "<?xml version='1.0' encoding='utf-8'?>",
+            '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">',
+            "  <channel>",
+            _xml_element(ind, "title", title),
+            _xml_element(ind, "link", f"{SITE_URL}/news.html"),
+            _xml_element(ind, "description", description),
+            _xml_element(ind, "language", "en-us"),
+            _xml_element(ind, "managingEditor", "admin@csoh.org (CSOH)"),
+            _xml_element(ind, "webMaster", "admin@csoh.org (CSOH)"),
+            _xml_element(ind, "lastBuildDate", format_datetime(self.newest_dt)),
+            _xml_element(ind, "ttl", "720"),
+            f'{ind}<atom:link href="{_xml_attr(self_url)}" rel="self" type="application/rss+xml" />',
+            f"{ind}<image>",
+            _xml_element(ind + "  ", "url", f"{SITE_URL}/favicon.png"),
+            _xml_element(ind + "  ", "title", FEED_TITLE),
+            _xml_element(ind + "  ", "link", f"{SITE_URL}/news.html"),
+            f"{ind}</image>",
+        ]
+        return "\n".join(head + items + ["  </channel>", "</rss>"])
+
+    def rss(self) -> str:
+        return self._rss(self.items, FEED_TITLE, FEED_DESCRIPTION, f"{SITE_URL}/feed.xml")
+
+    def json_feed(self, feed_url: str = f"{SITE_URL}/feed.json") -> str:
+        """The same entries as a JSON Feed 1.1 document (https://jsonfeed.org)."""
+        feed = {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": FEED_TITLE,
+            "home_page_url": f"{SITE_URL}/news.html",
+            "feed_url": feed_url,
+            "description": FEED_DESCRIPTION,
+            "icon": f"{SITE_URL}/favicon.png",
+            "favicon": f"{SITE_URL}/favicon.png",
+            "language": "en-US",
+            "authors": [{"name": "CSOH", "url": SITE_URL}],
+            "items": self.json_items,
+        }
+        return json.dumps(feed, ensure_ascii=False, indent=2) + "\n"
+
+    def tag_feeds(self, url_dir: str = "feeds") -> Dict[str, str]:
+        """RSS documents keyed by tag slug, one per tag (empty tags included)."""
+        return {
+            tag_slug(tag): self._rss(
+                items,
+                f"{FEED_TITLE}: {tag}",
+                f"{tag} news from the CSOH cloud security news feed.",
+                f"{SITE_URL}/{url_dir}/{tag_slug(tag)}.xml",
+            )
+            for tag, items in self.tag_items.items()
+        }
+
+
+def build_feed_xml(entries: List[Dict[str, str]], newest_iso: str) -> str:
+    writer = FeedWriter(newest_iso)
+    for entry in entries:
+        writer.add(entry)
+    return writer.rss()
 
 
 # Map source display names → slugs (must match img/news-banners/{slug}.jpg)
@@ -364,56 +994,227 @@ SOURCE_SLUGS = {
 }
 
 
-def render_card(entry: Dict[str, str], indent: str) -> str:
-    title = html.escape(html.unescape(entry["title"]))
-    link = html.escape(html.unescape(entry["link"]))
+def _source_label(entry: Dict[str, str]) -> str:
+    """Source names shown on a card: every source of a clustered story."""
+    return ", ".join(entry.get("sources") or [entry["source"]])
+
+
+class EntryView(NamedTuple):
+    """Everything the card, archive and feed outputs need from one entry.
+
+    Card fields are unescaped display text. ``card_lines`` is the escaped
+    card markup without its outer indent. Feed fields follow the feed's own
+    rules (raw title, 220-character summary); ``rss_item`` is None when the
+    entry has no date, since the feed then dates it by its newest entry.
+    """
+    title: str
+    link: str
+    summary: str
+    tooltip: str
+    date: str
+    published: str
+    category: str
+    tags: List[str]
+    source: str
+    source_label: str
+    source_slug: str
+    card_lines: Tuple[str, ...]
+    feed_title: str
+    feed_link: str
+    feed_summary: str
+    feed_tags: List[str]
+    feed_published: Optional[dt.datetime]
+    rss_item: Optional[str]
+
+
+def entry_key(entry: Dict[str, str]) -> str:
+    """Content hash of the entry fields that views are built from."""
+    fields = (
+        entry.get("title", ""), entry.get("link", ""), entry.get("summary", ""),
+        entry.get("source", ""), "\x1e".join(entry.get("sources") or ()), entry.get("published", ""),
+    )
+    return hashlib.blake2b("\x1f".join(fields).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def rss_item(title: str, link: str, summary: str, source: str, published: dt.datetime, tags: List[str]) -> str:
+    """One feed ``<item>``, serialized like ElementTree with ``ET.indent``."""
+    ind = " " * 6
+    lines = [
+        "    <item>",
+        _xml_element(ind, "title", title),
+        _xml_element(ind, "link", link),
+        _xml_element(ind, "description", summary),
+        _xml_element(ind, "source", source, f' url="{_xml_attr(link)}"'),
+        _xml_element(ind, "guid", link, ' isPermaLink="true"'),
+        _xml_element(ind, "pubDate", format_datetime(published)),
+    ]
+    lines.extend(_xml_element(ind, "category", tag) for tag in tags)
+    lines.append("    </item>")
+    return "\n".join(lines)
+
+
+def build_view(entry: Dict[str, str]) -> EntryView:
     full_summary = strip_html(html.unescape(entry.get("summary", "")))
     summary = full_summary
     if len(summary) > 180:
         summary = summary[:177].rstrip() + "..."
 
     # Build tooltip from the full summary when it's longer than the card text
-    tooltip_attr = ""
+    tooltip = ""
     if len(full_summary) > 180:
-        tooltip_text = full_summary[:400].rstrip()
+        tooltip = full_summary[:400].rstrip()
         if len(full_summary) > 400:
-            tooltip_text += "..."
-        tooltip_attr = f' data-tooltip="{html.escape(tooltip_text, quote=True)}"'
+            tooltip += "..."
 
-    published_dt = parse_date(entry.get("published", "")) or dt.datetime.now(dt.timezone.utc)
-    date_text, _ = format_date(published_dt)
+    published_dt = parse_date(entry.get("published", ""))
+    date_text, published_iso = format_date(published_dt or dt.datetime.now(dt.timezone.utc))
 
+    title = html.unescape(entry["title"])
+    link = html.unescape(entry["link"])
+    source = entry["source"]
+    source_label = _source_label(entry)
+    source_slug = SOURCE_SLUGS.get(source, "")
     category = classify_category(f"{entry['title']} {summary}")
-    tags = build_tags(f"{entry['title']} {summary} {entry['source']}")
-    source_slug = SOURCE_SLUGS.get(entry["source"], "")
-
-    tag_spans = "\n".join([f"{indent}            <span class=\"tag\">{html.escape(t)}</span>" for t in tags])
+    tags = build_tags(f"{entry['title']} {summary} {source}")
 
     source_attr = f' data-source="{source_slug}"' if source_slug else ""
-    banner_img = ""
+    tooltip_attr = f' data-tooltip="{html.escape(tooltip, quote=True)}"' if tooltip else ""
+    card_lines = [
+        f"<a href=\"{html.escape(link)}\" class=\"card-link\" target=\"_blank\" rel=\"noopener noreferrer\">",
+        f"    <div class=\"resource-card\" data-category=\"{category}\"{source_attr}{tooltip_attr}>",
+    ]
     if source_slug:
-        banner_img = (
-            f"{indent}        <img src=\"img/news-banners/{source_slug}.jpg\" "
-            f"alt=\"{html.escape(entry['source'])}\" "
-            f"class=\"resource-preview\" loading=\"lazy\">\n"
+        card_lines.append(
+            f"        <img src=\"img/news-banners/{source_slug}.jpg\" "
+            f"alt=\"{html.escape(source)}\" class=\"resource-preview\" loading=\"lazy\">"
         )
-
-    return (
-        f"{indent}<a href=\"{link}\" class=\"card-link\" target=\"_blank\" rel=\"noopener noreferrer\">\n"
-        f"{indent}    <div class=\"resource-card\" data-category=\"{category}\"{source_attr}{tooltip_attr}>\n"
-        f"{banner_img}"
-        f"{indent}        <h3>{title}</h3>\n"
-        f"{indent}        <p class=\"article-date\">{date_text}</p>\n"
-        f"{indent}        <p>{html.escape(summary)} <span class=\"source\">({html.escape(entry['source'])})</span></p>\n"
-        f"{indent}        <div class=\"resource-tags\">\n"
-        f"{tag_spans}\n"
-        f"{indent}        </div>\n"
-        f"{indent}    </div>\n"
-        f"{indent}</a>"
+    card_lines += [
+        f"        <h3>{html.escape(title)}</h3>",
+        f"        <p class=\"article-date\">{date_text}</p>",
+        f"        <p>{html.escape(summary)} <span class=\"source\">({html.escape(source_label)})</span></p>",
+        "        <div class=\"resource-tags\">",
+    ]
+    card_lines += [f"            <span class=\"tag\">{html.escape(t)}</span>" for t in tags]
+    card_lines += ["        </div>", "    </div>", "</a>"]
+
+    feed_title = entry.get("title", "").strip()
+    feed_link = entry.get("link", "").strip()
+    feed_summary = strip_html(entry.get("summary", ""))
+    if len(feed_summary) > 220:
+        feed_summary = feed_summary[:217].rstrip() + "..."
+    feed_source = entry.get("source", "Unknown Source")
+    feed_tags = build_tags(f"{feed_title} {feed_summary} {feed_source}")
+    item = None
+    if published_dt and feed_title and feed_link:
+        item = rss_item(feed_title, feed_link, feed_summary, feed_source, published_dt, feed_tags)
+
+    return EntryView(
+        title, link, summary, tooltip, date_text, published_iso, category, tags,
+        source, source_label, source_slug, tuple(card_lines),
+        feed_title, feed_link, feed_summary, feed_tags, published_dt, item,
     )
 
 
-def replace_grid(html_text: str, cards_html: str) -> str:
+class ViewCache:
+    """EntryViews keyed by entry_key, so each entry is summarized, tagged and
+    escaped once however many outputs (page, feeds, archive) it appears in.
+
+    Holds at most ``max_size`` views, dropping the oldest first; a daemon
+    reuses them across updates.
+    """
+
+    def __init__(self, max_size: int = VIEW_CACHE_SIZE):
+        self.max_size = max_size
+        self.views: Dict[str, EntryView] = {}
+
+    def get(self, entry: Dict[str, str], key: Optional[str] = None) -> EntryView:
+        key = key or entry_key(entry)
+        view = self.views.get(key)
+        if view is not None:
+            STATS.count("view_cache_hits")
+            return view
+        view = self.views[key] = build_view(entry)
+        if len(self.views) > self.max_size:
+            del self.views[next(iter(self.views))]
+        return view
+
+
+VIEWS = ViewCache()
+
+
+def render_card(entry: Dict[str, str], indent: str) -> str:
+    return indent + ("\n" + indent).join(VIEWS.get(entry).card_lines)
+
+
+ARCHIVE_FIELDS = (
+    "title", "link", "summary", "tooltip", "date", "published",
+    "category", "tags", "source", "source_label", "source_slug",
+)
+
+
+def build_archive(
+    stories: Sequence[Dict[str, str]],
+    shard_size: int = ARCHIVE_SHARD_SIZE,
+    previous: Optional[Dict[str, Dict]] = None,
+) -> Tuple[Dict[str, str], List[str]]:
+    """Render the archive from stories ordered oldest first.
+
+    Shard N holds stories [(N-1) * shard_size, N * shard_size), newest first
+    within the shard; index.json lists the shards newest first with their
+    date range so the page can fetch them in reading order. Each index entry
+    carries a hash of its stories' contents and scores; shards whose hash matches
+    ``previous`` (index entries by file name) are not rendered again.
+    Returns the files to write (name -> JSON text) and every shard name.
+    """
+    previous = previous or {}
+    shards = []
+    files: Dict[str, str] = {}
+    for number, chunk in enumerate(_chunks(stories, shard_size), start=1):
+        name = f"shard-{number:04d}.json"
+        keys = [entry_key(entry) for entry in chunk]
+        # Relevance is not part of the view, but a story scored later changes the shard
+        scores = json.dumps([entry.get("relevance") for entry in chunk])
+        digest = hashlib.blake2b(("".join(keys) + scores).encode("ascii"), digest_size=16).hexdigest()
+        old = previous.get(name)
+        if old and old.get("key") == digest:
+            shards.append(old)
+            continue
+        items = []
+        for entry, key in zip(reversed(chunk), reversed(keys)):
+            view = VIEWS.get(entry, key)
+            item = {field: getattr(view, field) for field in ARCHIVE_FIELDS}
+            # Kept so a store rebuilt from the archive ranks stories the same way
+            if entry.get("relevance") is not None:
+                item["relevance"] = entry["relevance"]
+            items.append(item)
+        files[name] = json.dumps({"items": items}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        shards.append({
+            "file": name,
+            "count": len(items),
+            "newest": items[0]["published"],
+            "oldest": items[-1]["published"],
+            "key": digest,
+        })
+    names = [shard["file"] for shard in shards]
+    shards.reverse()
+    files["index.json"] = json.dumps(
+        {"shard_size": shard_size, "total": len(stories), "shards": shards},
+        ensure_ascii=False, indent=2,
+    ) + "\n"
+    return files, names
+
+
+def load_archive_index(archive_dir: str) -> Dict[str, Dict]:
+    """Index entries of the shards currently on disk, by file name."""
+    shards = load_json(os.path.join(archive_dir, "index.json")).get("shards", [])
+    return {
+        shard["file"]: shard for shard in shards
+        if isinstance(shard, dict) and os.path.exists(os.path.join(archive_dir, str(shard.get("file"))))
+    }
+
+
+def _grid_bounds(html_text: str) -> Tuple[int, int]:
+    """Return the (start, end) offsets of the resource-grid container's contents."""
     marker = '<div class="resource-grid">'
     idx = html_text.find(marker)
     if idx == -1:
@@ -430,53 +1231,671 @@ def replace_grid(html_text: str, cards_html: str) -> str:
         else:
             depth += 1
         if depth == 0:
-            end = match.start()
-            return html_text[:start] + "\n" + cards_html + "\n" + html_text[end:]
+            return start, match.start()
 
     raise ValueError("Could not find end of resource-grid container")
 
 
+def replace_grid(html_text: str, cards_html: str) -> str:
+    start, end = _grid_bounds(html_text)
+    return html_text[:start] + "\n" + cards_html + "\n" + html_text[end:]
+
+
+CARD_BLOCK_PATTERN = re.compile(r'[ \t]*<a href="([^"]*)" class="card-link".*?</a>', re.DOTALL)
+
+
+def splice_cards(html_text: str, entries: List[Dict[str, str]], indent: str) -> str:
+    """Rebuild the card grid for ``entries``, reusing existing cards verbatim.
+
+    Cards already on the page (matched by link) keep their exact bytes; only
+    entries that are new to the page, or whose story picked up another
+    source, are rendered. Cards for entries that are no longer in
+    ``entries`` are dropped.
+    """
+    start, end = _grid_bounds(html_text)
+    existing = {m.group(1): m.group(0) for m in CARD_BLOCK_PATTERN.finditer(html_text, start, end)}
+    cards = []
+    for entry in entries:
+        card = existing.get(html.escape(html.unescape(entry["link"])))
+        source_span = f'<span class="source">({html.escape(_source_label(entry))})</span>'
+        if card is None or source_span not in card:
+            card = render_card(entry, indent)
+        cards.append(card)
+    return replace_grid(html_text, "\n".join(cards))
+
+
 def update_date_modified(html_text: str, iso_date: str) -> str:
     html_text = re.sub(r'"dateModified"\s*:\s*"[^"]+"', f'"dateModified": "{iso_date}"', html_text, count=1)
     html_text = re.sub(r'og:updated_time"\s+content="[^"]+"', f'og:updated_time" content="{iso_date}"', html_text, count=1)
     return html_text
 
 
-def build_entries(news_path: str, resources_path: str, max_articles: int, min_sources: int) -> Tuple[List[Dict[str, str]], str]:
-    existing = load_existing_urls(news_path, resources_path)
-    collected: List[Dict[str, str]] = []
+CARD_PATTERN = re.compile(
+    r'<a href="([^"]+)" class="card-link"[^>]*>\s*'
+    r'<div class="resource-card"([^>]*)>.*?'
+    r'<h3>(.*?)</h3>\s*<p class="article-date">([^<]*)</p>\s*'
+    r'<p>(.*?) <span class="source">\(([^)]*)\)</span></p>',
+    re.DOTALL,
+)
 
-    for feed in FEEDS:
-        xml_text = fetch_feed(feed["url"])
-        if not xml_text:
-            continue
-        for item in parse_rss(xml_text, feed["name"]):
-            if not item.get("title") or not item.get("link"):
-                continue
-            combined = f"{item['title']} {item.get('summary', '')}"
-            if not is_relevant(combined):
-                continue
-            norm = normalize_url(item["link"])
-            if norm in existing:
-                continue
-            resolved = normalize_url(resolve_url(norm))
-            if resolved in existing:
-                continue
-            item["link"] = resolved
-            collected.append(item)
 
-    if not collected:
-        raise ValueError("No news items found from feeds")
+def extract_cards(html_text: str) -> List[Dict[str, str]]:
+    """Recover entries from the cards rendered into news.html by render_card."""
+    entries = []
+    for m in CARD_PATTERN.finditer(html_text):
+        link, attrs, title, date_text, summary, sources = m.groups()
+        tooltip = re.search(r'data-tooltip="([^"]*)"', attrs)
+        published = ""
+        try:
+            published = format_date(dt.datetime.strptime(date_text.strip(), "%B %d, %Y"))[1]
+        except ValueError:
+            pass
+        entries.append({
+            "title": html.unescape(title),
+            "link": html.unescape(link),
+            "published": published,
+            # The tooltip holds more of the summary than the card text does.
+            "summary": html.unescape(tooltip.group(1) if tooltip else summary),
+            # Clustered stories list every source; the card's own article is the first.
+            "source": html.unescape(sources).split(", ")[0],
+            "sources": html.unescape(sources).split(", "),
+        })
+    return entries
+
 
-    # Sort by published date (newest first)
-    collected.sort(
-        key=lambda x: parse_date(x.get("published", ""))
-        or dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc),
+def poll_interval(items: Iterable[Dict[str, str]]) -> Optional[int]:
+    """Seconds between polls for a feed, from the publish times of its items.
+
+    Half the median gap between consecutive posts, clamped to the poll
+    limits. None when fewer than two items carry a date.
+    """
+    stamps = sorted(
+        (d.timestamp() for d in (parse_date(item.get("published", "")) for item in items) if d),
         reverse=True,
     )
+    gaps = sorted(newer - older for newer, older in zip(stamps, stamps[1:]))
+    if not gaps:
+        return None
+    median = gaps[len(gaps) // 2]
+    return int(min(max(median / 2, POLL_MIN_INTERVAL), POLL_MAX_INTERVAL))
+
+
+def failure_backoff(failures: int) -> int:
+    """Seconds to wait before retrying a feed that failed ``failures`` times in a row."""
+    return min(POLL_MIN_INTERVAL * 2 ** min(failures, 16), POLL_MAX_INTERVAL)
+
+
+_STOPWORDS = frozenset(
+    "the and for with from that this are was were has have how its into over new via "
+    "your you our what who why can will not but all out use uses using".split()
+)
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+# Fixed (a, b) pairs for the MinHash permutations h -> (a*h + b) mod p. They
+# are derived from a hash rather than ``random`` so stored bands stay valid
+# across Python versions.
+_MINHASH_SEEDS = [
+    (_hash64(f"minhash-a-{i}") % (_MERSENNE_PRIME - 1) + 1, _hash64(f"minhash-b-{i}") % _MERSENNE_PRIME)
+    for i in range(MINHASH_PERMUTATIONS)
+]
+
+
+def story_tokens(title: str, summary: str) -> frozenset:
+    """Distinctive words of a story: the title plus the start of its summary."""
+    text = f"{title} {strip_html(html.unescape(summary))[:200]}"
+    return frozenset(
+        word for word in re.findall(r"\w+", html.unescape(text).lower())
+        if len(word) > 2 and word not in _STOPWORDS
+    )
+
+
+def minhash_bands(tokens: frozenset) -> List[int]:
+    """LSH band keys of the MinHash signature of ``tokens`` (signed 64-bit)."""
+    if not tokens:
+        return []
+    hashes = [_hash64(token) for token in tokens]
+    signature = [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _MINHASH_SEEDS]
+    bands = []
+    for start in range(0, MINHASH_PERMUTATIONS, MINHASH_BAND_ROWS):
+        rows = ",".join(map(str, signature[start:start + MINHASH_BAND_ROWS]))
+        bands.append(int.from_bytes(hashlib.blake2b(rows.encode("ascii"), digest_size=8).digest(), "big", signed=True))
+    return bands
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+class RelevanceScorer:
+    """TF-IDF similarity of new articles to the articles already published.
+
+    Built once per run from reference texts: document frequencies give the
+    IDF weights, and the normalized sum of the reference vectors is the
+    centroid. Vectors are sparse dicts; ``score_batch`` vectorizes a batch
+    of texts and takes each one's dot product with the centroid, touching
+    only the terms the text contains.
+    """
+
+    _TERM_RE = re.compile(r"[a-z0-9][a-z0-9\-]+")
+
+    def __init__(self, documents: Sequence[str]):
+        docs = [self.terms(text) for text in documents]
+        df: Dict[str, int] = {}
+        for terms in docs:
+            for term in set(terms):
+                df[term] = df.get(term, 0) + 1
+        n = len(docs)
+        self.idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+        self.unseen_idf = math.log(1 + n) + 1
+        centroid: Dict[str, float] = {}
+        for terms in docs:
+            for term, weight in self.vectorize(terms).items():
+                centroid[term] = centroid.get(term, 0.0) + weight
+        self.centroid = self._normalize(centroid)
+
+    @classmethod
+    def terms(cls, text: str) -> List[str]:
+        return [
+            term for term in cls._TERM_RE.findall(strip_html(html.unescape(text)).lower())
+            if term not in _STOPWORDS
+        ]
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        return {term: w / norm for term, w in vector.items()} if norm else {}
+
+    def vectorize(self, terms: List[str]) -> Dict[str, float]:
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        return self._normalize({
+            term: count * self.idf.get(term, self.unseen_idf) for term, count in counts.items()
+        })
+
+    def score_batch(self, texts: Sequence[str]) -> List[float]:
+        """Cosine similarity of each text to the centroid, in input order."""
+        centroid = self.centroid
+        return [
+            sum(weight * centroid.get(term, 0.0) for term, weight in self.vectorize(self.terms(text)).items())
+            for text in texts
+        ]
+
+
+def _chunks(items: Sequence, size: int) -> Iterable[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class ArticleStore:
+    """SQLite store of every article accepted into the news page.
+
+    Articles are keyed by normalized URL; ``url_aliases`` also records the
+    pre-redirect feed links and the links curated in resources.html, so
+    duplicate checks are a single indexed lookup.
+
+    Each article's MinHash bands are indexed in ``minhash_bands``. A new
+    article that closely matches a recent one joins that article's
+    ``cluster_id``; the page shows one card per cluster. A store seeded
+    from news.html or the archive only gets each card's first article, so
+    the card's other sources go into ``cluster_sources`` to keep the same
+    source list on the page.
+
+    ``feed_state`` holds the polling schedule of each feed (see
+    ``due_feeds`` and ``record_poll``).
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY,
+            norm_url TEXT NOT NULL UNIQUE,
+            link TEXT NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT NOT NULL DEFAULT '',
+            source TEXT NOT NULL,
+            published TEXT NOT NULL DEFAULT '',
+            published_at TEXT NOT NULL,
+            first_seen TEXT NOT NULL,
+            cluster_id INTEGER,
+            relevance REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+        CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at);
+        CREATE TABLE IF NOT EXISTS minhash_bands (
+            band INTEGER NOT NULL,
+            value INTEGER NOT NULL,
+            article_id INTEGER NOT NULL,
+            PRIMARY KEY (band, value, article_id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS url_aliases (
+            norm_url TEXT PRIMARY KEY,
+            origin TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS cluster_sources (
+            cluster_id INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            UNIQUE (cluster_id, source)
+        );
+        CREATE TABLE IF NOT EXISTS feed_state (
+            url TEXT PRIMARY KEY,
+            last_polled REAL NOT NULL,
+            next_due REAL NOT NULL,
+            interval INTEGER NOT NULL,
+            failures INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(self.SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(articles)")}
+        if "cluster_id" not in columns:
+            self.conn.execute("ALTER TABLE articles ADD COLUMN cluster_id INTEGER")
+        if "relevance" not in columns:
+            self.conn.execute("ALTER TABLE articles ADD COLUMN relevance REAL")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_cluster ON articles(cluster_id)")
+        self.cluster_new()
+        self.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def has_url(self, norm_url: str) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM articles WHERE norm_url = ? UNION ALL SELECT 1 FROM url_aliases WHERE norm_url = ? LIMIT 1",
+            (norm_url, norm_url),
+        ).fetchone() is not None
+
+    def add_alias(self, norm_url: str, origin: str) -> None:
+        self.conn.execute(
+            "INSERT OR IGNORE INTO url_aliases (norm_url, origin) VALUES (?, ?)", (norm_url, origin)
+        )
+
+    def upsert(self, entry: Dict[str, str], now: Optional[dt.datetime] = None) -> bool:
+        """Insert an article, or refresh its text if the URL is already stored.
+
+        Returns True when a new article joined an existing story cluster.
+        """
+        now = now or dt.datetime.now(dt.timezone.utc)
+        _, first_seen = format_date(now)
+        published = entry.get("published", "")
+        published_dt = parse_date(published)
+        if published_dt is None:
+            published, published_at = "", first_seen
+        else:
+            _, published_at = format_date(published_dt)
+        self.conn.execute(
+            """
+            INSERT INTO articles (
+                norm_url, link, title, summary, source, published, published_at, first_seen, relevance
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(norm_url) DO UPDATE SET
+                title = excluded.title,
+                summary = excluded.summary,
+                published = excluded.published,
+                published_at = excluded.published_at,
+                relevance = COALESCE(excluded.relevance, relevance)
+            """,
+            (
+                normalize_url(entry["link"]),
+                entry["link"],
+                entry["title"],
+                entry.get("summary", ""),
+                entry["source"],
+                published,
+                published_at,
+                first_seen,
+                entry.get("relevance"),
+            ),
+        )
+        return self.cluster_new() > 0
+
+    def cluster_new(self) -> int:
+        """Index and cluster every article that is not in a cluster yet.
+
+        Returns how many of them joined an existing cluster.
+        """
+        rows = self.conn.execute(
+            "SELECT id, title, summary, source, published_at FROM articles WHERE cluster_id IS NULL ORDER BY id"
+        ).fetchall()
+        joined = 0
+        for row in rows:
+            tokens = story_tokens(row["title"], row["summary"])
+            bands = minhash_bands(tokens)
+            cluster_id = self._near_duplicate(tokens, bands, row["source"], row["published_at"])
+            if cluster_id is None:
+                cluster_id = row["id"]
+            else:
+                joined += 1
+            self.conn.execute("UPDATE articles SET cluster_id = ? WHERE id = ?", (cluster_id, row["id"]))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO minhash_bands (band, value, article_id) VALUES (?, ?, ?)",
+                ((band, value, row["id"]) for band, value in enumerate(bands)),
+            )
+        return joined
+
+    def _near_duplicate(
+        self, tokens: frozenset, bands: List[int], source: str, published_at: str
+    ) -> Optional[int]:
+        """Cluster id of the most similar recent article from another source, if similar enough."""
+        if not bands:
+            return None
+        where = " OR ".join("(b.band = ? AND b.value = ?)" for _ in bands)
+        params: List = [x for pair in enumerate(bands) for x in pair]
+        rows = self.conn.execute(
+            f"SELECT DISTINCT a.id, a.title, a.summary, a.cluster_id FROM minhash_bands b "
+            f"JOIN articles a ON a.id = b.article_id "
+            f"WHERE ({where}) AND a.source != ? AND ABS(julianday(a.published_at) - julianday(?)) <= ?",
+            params + [source, published_at, CLUSTER_WINDOW_DAYS],
+        ).fetchall()
+        best = None
+        for row in rows:
+            score = jaccard(tokens, story_tokens(row["title"], row["summary"]))
+            if score >= CLUSTER_SIMILARITY and (best is None or score > best[0]):
+                best = (score, row["cluster_id"])
+        return best[1] if best else None
+
+    def latest(self, limit: int) -> List[Dict[str, str]]:
+        """The best ``limit`` of the newest stories, newest first, as render_card entries.
+
+        Each story is the first article of its cluster; ``sources`` lists the
+        sources of every article in the cluster, first one first. Stories
+        are picked from the newest ``2 * limit`` by relevance halved every
+        RELEVANCE_HALF_LIFE_HOURS of age. Unscored stories (seeded before
+        scoring started) count as the median score of the pool, so they
+        neither crowd out nor give way to every scored story.
+        """
+        pool = self.conn.execute(
+            "SELECT id, link, title, summary, source, published, published_at, relevance FROM articles "
+            "WHERE cluster_id = id ORDER BY published_at DESC, id ASC LIMIT ?",
+            (2 * limit,),
+        ).fetchall()
+        if len(pool) > limit:
+            newest = parse_date(pool[0]["published_at"])
+            scores = [row["relevance"] for row in pool if row["relevance"] is not None]
+            neutral = statistics.median(scores) if scores else 1.0
+
+            def rank(row: sqlite3.Row) -> float:
+                age = (newest - parse_date(row["published_at"])).total_seconds() / 3600
+                score = neutral if row["relevance"] is None else row["relevance"]
+                return score * 0.5 ** (age / RELEVANCE_HALF_LIFE_HOURS)
+
+            keep = {row["id"] for row in sorted(pool, key=rank, reverse=True)[:limit]}
+            pool = [row for row in pool if row["id"] in keep]
+        return self._stories(pool)
+
+    def archive(self) -> List[Dict[str, str]]:
+        """Every story in the store, oldest first, as render_card entries."""
+        rows = self.conn.execute(
+            "SELECT id, link, title, summary, source, published, published_at, relevance FROM articles "
+            "WHERE cluster_id = id ORDER BY published_at ASC, id ASC"
+        ).fetchall()
+        return self._stories(rows)
+
+    def _stories(self, rows: Sequence[sqlite3.Row]) -> List[Dict[str, str]]:
+        sources: Dict[int, List[str]] = {row["id"]: [] for row in rows}
+        for chunk in _chunks(list(sources), 500):
+            placeholders = ", ".join("?" * len(chunk))
+            for member in self.conn.execute(
+                f"SELECT cluster_id, source FROM articles WHERE cluster_id IN ({placeholders}) "
+                f"ORDER BY id",
+                chunk,
+            ):
+                names = sources[member["cluster_id"]]
+                if member["source"] not in names:
+                    names.append(member["source"])
+            # Sources of seeded cards whose articles were never stored
+            for extra in self.conn.execute(
+                f"SELECT cluster_id, source FROM cluster_sources WHERE cluster_id IN ({placeholders}) "
+                f"ORDER BY rowid",
+                chunk,
+            ):
+                names = sources[extra["cluster_id"]]
+                if extra["source"] not in names:
+                    names.append(extra["source"])
+        return [
+            {
+                "title": row["title"],
+                "link": row["link"],
+                "summary": row["summary"],
+                "source": row["source"],
+                "sources": sources[row["id"]],
+                "published": row["published"] or row["published_at"],
+                "relevance": row["relevance"],
+            }
+            for row in rows
+        ]
+
+    def import_cards(self, news_path: str, feed_path: Optional[str] = None) -> int:
+        """Seed an empty store from the cards currently in news.html.
+
+        Cards only show the publication day, so exact timestamps are taken
+        from the matching items in feed.xml when it is available.
+        """
+        try:
+            with open(news_path, "r", encoding="utf-8") as f:
+                entries = extract_cards(f.read())
+        except FileNotFoundError:
+            return 0
+        published: Dict[str, str] = {}
+        if feed_path:
+            try:
+                with open(feed_path, "r", encoding="utf-8") as f:
+                    for item in parse_rss(f.read(), "", max_items=len(entries) or 1):
+                        published[normalize_url(item["link"])] = item["published"]
+            except FileNotFoundError:
+                pass
+        for entry in entries:
+            exact = published.get(normalize_url(entry["link"]))
+            self.upsert(dict(entry, published=exact) if exact else entry)
+            self._import_sources(entry["link"], entry["sources"])
+        self.commit()
+        return len(entries)
+
+    def import_archive(self, archive_dir: str) -> int:
+        """Seed an empty store from the JSON archive written by build_archive, oldest first.
+
+        news.html only holds the newest cards, so without this a lost store
+        would also shrink the archive to the cards on the page.
+        """
+        try:
+            with open(os.path.join(archive_dir, "index.json"), "r", encoding="utf-8") as f:
+                shards = json.load(f).get("shards", [])
+        except (FileNotFoundError, ValueError):
+            return 0
+        imported = 0
+        for shard in reversed(shards):
+            try:
+                with open(os.path.join(archive_dir, os.path.basename(shard["file"])), "r", encoding="utf-8") as f:
+                    items = json.load(f).get("items", [])
+            except (FileNotFoundError, ValueError):
+                continue
+            for item in reversed(items):
+                self.upsert({
+                    "title": item["title"],
+                    "link": item["link"],
+                    # The tooltip holds more of the summary than the card text does.
+                    "summary": item.get("tooltip") or item.get("summary", ""),
+                    "source": item["source"],
+                    "published": item.get("published", ""),
+                    "relevance": item.get("relevance"),
+                })
+                # source_label lists every source of a clustered story, first one first
+                self._import_sources(item["link"], item.get("source_label", "").split(", "))
+                imported += 1
+        self.commit()
+        return imported
+
+    def _import_sources(self, link: str, sources: Sequence[str]) -> None:
+        """Record the sources after the first one listed on a seeded card."""
+        extra = [name for name in sources[1:] if name]
+        if not extra:
+            return
+        row = self.conn.execute(
+            "SELECT cluster_id FROM articles WHERE norm_url = ?", (normalize_url(link),)
+        ).fetchone()
+        if row is None:
+            return
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO cluster_sources (cluster_id, source) VALUES (?, ?)",
+            ((row["cluster_id"], name) for name in extra),
+        )
+
+    def reference_texts(self, limit: int) -> List[str]:
+        """Title and summary of the newest ``limit`` articles, for RelevanceScorer."""
+        return [
+            f"{row['title']} {row['summary']}"
+            for row in self.conn.execute(
+                "SELECT title, summary FROM articles ORDER BY published_at DESC LIMIT ?", (limit,)
+            )
+        ]
+
+    def score_unscored(self, scorer: RelevanceScorer) -> int:
+        """Give every article without a relevance score one; returns how many."""
+        rows = self.conn.execute("SELECT id, title, summary FROM articles WHERE relevance IS NULL").fetchall()
+        scores = scorer.score_batch([f"{row['title']} {row['summary']}" for row in rows])
+        self.conn.executemany(
+            "UPDATE articles SET relevance = ? WHERE id = ?",
+            ((round(score, 4), row["id"]) for score, row in zip(scores, rows)),
+        )
+        return len(rows)
+
+    def due_feeds(self, feeds: Sequence[Dict[str, str]], now: Optional[float] = None) -> List[Dict[str, str]]:
+        """The feeds whose next poll is due (never-polled feeds always are), in input order."""
+        now = time.time() if now is None else now
+        next_due = {row["url"]: row["next_due"] for row in self.conn.execute("SELECT url, next_due FROM feed_state")}
+        return [feed for feed in feeds if next_due.get(feed["url"], 0) <= now + POLL_GRACE]
+
+    def record_poll(
+        self, url: str, items: Optional[List[Dict[str, str]]], now: Optional[float] = None
+    ) -> float:
+        """Schedule a feed's next poll after fetching it; ``items`` is None on failure.
+
+        Returns the time the feed is next due.
+        """
+        now = time.time() if now is None else now
+        row = self.conn.execute("SELECT interval, failures FROM feed_state WHERE url = ?", (url,)).fetchone()
+        interval = row["interval"] if row else POLL_MIN_INTERVAL
+        if items is None:
+            failures = (row["failures"] if row else 0) + 1
+            next_due = now + failure_backoff(failures)
+        else:
+            failures = 0
+            interval = poll_interval(items) or interval
+            next_due = now + interval
+        self.conn.execute(
+            "INSERT OR REPLACE INTO feed_state (url, last_polled, next_due, interval, failures) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (url, now, next_due, interval, failures),
+        )
+        return next_due
+
+    def sync_resources(self, resources_path: str) -> None:
+        """Record every link in resources.html so news never duplicates a curated resource.
 
-    # Select purely by date order
-    selected: List[Dict[str, str]] = collected[:max_articles]
+        The file is only re-scanned when its content changes.
+        """
+        try:
+            with open(resources_path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'resources_sha256'").fetchone()
+        if row is not None and row["value"] == digest:
+            return
+        self.conn.execute("DELETE FROM url_aliases WHERE origin = 'resources'")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO url_aliases (norm_url, origin) VALUES (?, 'resources')",
+            ((normalize_url(u),) for u in extract_links(text)),
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('resources_sha256', ?)", (digest,)
+        )
+        self.commit()
+
+
+def build_entries(
+    news_path: str,
+    resources_path: str,
+    max_articles: int,
+    min_sources: int,
+    workers: int = FETCH_WORKERS,
+    per_host: int = FETCH_PER_HOST,
+    cache_dir: Optional[str] = CACHE_DIR,
+    max_items_per_feed: int = FEED_ITEM_LIMIT,
+    store: Optional[ArticleStore] = None,
+    feed_path: Optional[str] = None,
+    all_feeds: bool = False,
+    feed_cache: Optional[FeedCache] = None,
+    redirect_cache: Optional[RedirectCache] = None,
+    min_relevance: float = RELEVANCE_MIN_SCORE,
+    archive_dir: Optional[str] = None,
+) -> Tuple[List[Dict[str, str]], str]:
+    """Fetch feeds, add new relevant articles to ``store`` and return the newest ones.
+
+    Only feeds that are due are polled unless ``all_feeds`` is set. Caches
+    under ``cache_dir`` are used unless ``feed_cache``/``redirect_cache``
+    are passed in (the daemon keeps them in memory). New articles scoring
+    below ``min_relevance`` against past articles are dropped. An empty
+    store is seeded from ``archive_dir`` and the cards in ``news_path``.
+    Returns the ``max_articles`` stories chosen by ``ArticleStore.latest``
+    (newest first) and the ISO timestamp of the newest one.
+    """
+    own_redirects = cache_dir and redirect_cache is None
+    if cache_dir:
+        feed_cache = feed_cache or FeedCache(os.path.join(cache_dir, FEED_CACHE_NAME))
+        redirect_cache = redirect_cache or RedirectCache(os.path.join(cache_dir, RESOLVE_CACHE_NAME))
+    own_store = store is None
+    if own_store:
+        store = ArticleStore(ARTICLE_DB)
+    try:
+        with STATS.stage("store"):
+            if store.count() == 0:
+                if archive_dir:
+                    STATS.count("seeded_from_archive", store.import_archive(archive_dir))
+                STATS.count("seeded_from_page", store.import_cards(news_path, feed_path))
+            store.sync_resources(resources_path)
+        scorer = None
+        if store.count() >= RELEVANCE_MIN_REFERENCE:
+            with STATS.stage("score"):
+                scorer = RelevanceScorer(store.reference_texts(RELEVANCE_REFERENCE_SIZE))
+                store.score_unscored(scorer)
+        added = _collect_articles(
+            store, workers, per_host, max_items_per_feed, all_feeds, feed_cache, redirect_cache,
+            scorer, min_relevance,
+        )
+        STATS.count("articles_added", added)
+        with STATS.stage("store"):
+            selected = store.latest(max_articles)
+    finally:
+        if own_store:
+            store.close()
+        if own_redirects:
+            redirect_cache.close()
+
+    if not selected:
+        raise ValueError("No news items found from feeds")
 
     sources = {item["source"] for item in selected}
     if len(sources) < min_sources:
@@ -487,7 +1906,267 @@ def build_entries(news_path: str, resources_path: str, max_articles: int, min_so
 
     newest = parse_date(selected[0].get("published", "")) or dt.datetime.now(dt.timezone.utc)
     _, newest_iso = format_date(newest)
-    return selected[:max_articles], newest_iso
+    return selected, newest_iso
+
+
+def _collect_articles(
+    store: ArticleStore,
+    workers: int,
+    per_host: int,
+    max_items_per_feed: int,
+    all_feeds: bool = False,
+    feed_cache: Optional[FeedCache] = None,
+    redirect_cache: Optional[RedirectCache] = None,
+    scorer: Optional[RelevanceScorer] = None,
+    min_relevance: float = RELEVANCE_MIN_SCORE,
+) -> int:
+    """Fetch due feeds and upsert relevant, previously unseen items into ``store``.
+
+    Items that pass the keyword filter and are not stored yet are scored
+    in one batch before any of them is resolved or stored.
+    """
+    feeds = FEEDS if all_feeds else store.due_feeds(FEEDS)
+    STATS.count("feeds_skipped", len(FEEDS) - len(feeds))
+    with STATS.stage("fetch"):
+        results = fetch_feeds(feeds, max_workers=workers, per_host=per_host, cache=feed_cache)
+
+    candidates: List[Tuple[str, Dict[str, str], str]] = []
+    for feed, (status, xml_text, validators) in zip(feeds, results):
+        name = feed["name"]
+        if status == 304 and feed_cache is not None:
+            items = feed_cache.items(feed["url"])
+            store.record_poll(feed["url"], items or [])
+            if items is None:
+                continue
+            STATS.count("feed_cache_hits")
+        elif xml_text:
+            with STATS.stage("parse"):
+                items = parse_rss(xml_text, name, max_items=max_items_per_feed)
+            if feed_cache is not None:
+                feed_cache.store(feed["url"], validators, items)
+            store.record_poll(feed["url"], items)
+        else:
+            STATS.count("feed_failures")
+            store.record_poll(feed["url"], None)
+            continue
+        STATS.feed(name, items=len(items), irrelevant=0, duplicate=0, added=0)
+        for item in items:
+            if not item.get("title") or not item.get("link"):
+                STATS.feed_count(name, "irrelevant")
+                continue
+            combined = f"{item['title']} {item.get('summary', '')}"
+            with STATS.stage("filter"):
+                relevant = is_relevant(combined)
+            if not relevant:
+                STATS.feed_count(name, "irrelevant")
+                continue
+            norm = normalize_url(item["link"])
+            if store.has_url(norm):
+                STATS.feed_count(name, "duplicate")
+                continue
+            candidates.append((name, item, norm))
+    store.commit()
+
+    if scorer is not None and candidates:
+        with STATS.stage("score"):
+            scores = scorer.score_batch([f"{item['title']} {item.get('summary', '')}" for _, item, _ in candidates])
+        scored = []
+        for (name, item, norm), score in zip(candidates, scores):
+            if score < min_relevance:
+                STATS.feed_count(name, "irrelevant")
+                STATS.count("low_relevance")
+                continue
+            scored.append((name, dict(item, relevance=round(score, 4)), norm))
+        candidates = scored
+
+    added = 0
+    for name, item, norm in candidates:
+        if store.has_url(norm):  # the same link from an earlier feed in this run
+            STATS.feed_count(name, "duplicate")
+            continue
+        with STATS.stage("resolve"):
+            resolved = normalize_url(resolve_url(norm, cache=redirect_cache))
+        if resolved != norm:
+            store.add_alias(norm, "redirect")
+        if store.has_url(resolved):
+            STATS.feed_count(name, "duplicate")
+            continue
+        with STATS.stage("store"):
+            if store.upsert(dict(item, link=resolved)):
+                STATS.count("clustered")
+        STATS.feed_count(name, "added")
+        added += 1
+    store.commit()
+
+    if feed_cache is not None:
+        feed_cache.save()
+    if redirect_cache is not None:
+        redirect_cache.save()
+    return added
+
+
+def remove_stale_shards(archive_dir: str, shard_paths: Sequence[str], writer: ArtifactWriter) -> None:
+    """Delete archive shards left over from a larger archive or another shard size."""
+    try:
+        names = os.listdir(archive_dir)
+    except FileNotFoundError:
+        return
+    keep = set(shard_paths)
+    for name in sorted(names):
+        path = os.path.join(archive_dir, name)
+        if re.fullmatch(r"shard-\d+\.json", name) and path not in keep:
+            writer.remove(path)
+
+
+class NewsUpdater:
+    """Updates news.html and feed.xml, keeping state between updates.
+
+    The article store, feed cache and redirect cache stay open for the
+    lifetime of the updater, so a daemon pays for loading them once.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.store = ArticleStore(args.db)
+        cache_dir = None if args.no_cache else args.cache_dir
+        self.feed_cache = FeedCache(os.path.join(cache_dir, FEED_CACHE_NAME)) if cache_dir else None
+        self.redirect_cache = RedirectCache(os.path.join(cache_dir, RESOLVE_CACHE_NAME)) if cache_dir else None
+        self._rendered: Optional[Tuple[int, List[Tuple]]] = None
+
+    def close(self) -> None:
+        self.store.close()
+        if self.redirect_cache is not None:
+            self.redirect_cache.close()
+        HTTP.close()
+
+    def run_once(self) -> int:
+        """Poll due feeds and regenerate the outputs if the article set changed."""
+        args = self.args
+        STATS.reset()
+        try:
+            entries, newest_iso = build_entries(
+                args.news_file,
+                args.resources_file,
+                args.max_articles,
+                args.min_sources,
+                workers=args.workers,
+                per_host=args.per_host,
+                cache_dir=None,
+                max_items_per_feed=args.max_items_per_feed,
+                store=self.store,
+                feed_path=args.feed_file,
+                all_feeds=args.all_feeds,
+                feed_cache=self.feed_cache,
+                redirect_cache=self.redirect_cache,
+                min_relevance=args.min_relevance,
+                archive_dir=args.archive_dir,
+            )
+        except Exception as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+
+        summary = (
+            f"{len(entries)} articles from {len({e['source'] for e in entries})} sources"
+        )
+        # The article count covers stories that only reach the archive
+        rendered = (
+            self.store.count(),
+            [(e["link"], e["title"], e["published"], tuple(e.get("sources", ()))) for e in entries],
+        )
+        if rendered == self._rendered:
+            print(f"No changes: {args.news_file} and {args.feed_file} already have {summary}.")
+            self.report_stats()
+            return 0
+
+        indent = " " * 16
+
+        try:
+            with open(args.news_file, "r", encoding="utf-8") as f:
+                original_html = f.read()
+        except FileNotFoundError:
+            print(f"Error: {args.news_file} not found", file=sys.stderr)
+            return 1
+
+        # With an archive, the page keeps only the newest cards; the rest load on scroll
+        page = entries[:args.page_articles] if args.archive_dir else entries
+        with STATS.stage("render"):
+            if args.full_render:
+                cards_html = "\n".join(render_card(entry, indent) for entry in page)
+                html_text = replace_grid(original_html, cards_html)
+            else:
+                html_text = splice_cards(original_html, page, indent)
+            html_text = update_date_modified(html_text, newest_iso)
+        with STATS.stage("feeds"):
+            writer = FeedWriter(newest_iso)
+            for entry in entries:
+                writer.add(entry)
+            outputs = {args.news_file: html_text, args.feed_file: writer.rss()}
+            if args.json_feed_file:
+                outputs[args.json_feed_file] = writer.json_feed()
+            if args.tag_feed_dir:
+                url_dir = args.tag_feed_dir.strip("/")
+                for slug, text in writer.tag_feeds(url_dir).items():
+                    outputs[os.path.join(args.tag_feed_dir, f"{slug}.xml")] = text
+        shard_paths: List[str] = []
+        if args.archive_dir:
+            with STATS.stage("archive"):
+                previous = None if args.full_render else load_archive_index(args.archive_dir)
+                files, shard_names = build_archive(self.store.archive(), previous=previous)
+                for name, text in files.items():
+                    outputs[os.path.join(args.archive_dir, name)] = text
+                shard_paths = [os.path.join(args.archive_dir, name) for name in shard_names]
+
+        with STATS.stage("write"):
+            artifacts = ArtifactWriter()
+            for path, text in outputs.items():
+                artifacts.write(path, text)
+            if args.archive_dir:
+                remove_stale_shards(args.archive_dir, shard_paths, artifacts)
+            changed = artifacts.changed + artifacts.removed
+        self._rendered = rendered
+
+        if changed:
+            groups = (("tag feeds", args.tag_feed_dir), ("archive files", args.archive_dir))
+            in_dir = {
+                label: [path for path in changed if directory and path.startswith(directory + os.sep)]
+                for label, directory in groups
+            }
+            names = [path for path in changed if not any(path in paths for paths in in_dir.values())]
+            names += [f"{len(paths)} {label}" for label, paths in in_dir.items() if paths]
+            print(f"Updated {', '.join(names)} with {summary}.")
+        else:
+            print(f"No changes: {args.news_file} and {args.feed_file} already have {summary}.")
+        self.report_stats()
+        return 0
+
+    def report_stats(self) -> None:
+        if self.args.stats == "table":
+            print(STATS.format_table())
+        elif self.args.stats == "json":
+            print(json.dumps(STATS.as_dict(), indent=2))
+        if self.args.stats_file:
+            atomic_write(self.args.stats_file, json.dumps(STATS.as_dict(), indent=2))
+
+
+def run_daemon(updater: NewsUpdater, interval: float) -> int:
+    """Run ``updater`` every ``interval`` seconds until SIGINT or SIGTERM."""
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        print(f"Received {signal.Signals(signum).name}; stopping after the current update.", file=sys.stderr)
+        stop.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    while not stop.is_set():
+        started = time.monotonic()
+        try:
+            updater.run_once()
+        except Exception as exc:  # keep the daemon alive; the next update may succeed
+            print(f"Error: {exc}", file=sys.stderr)
+        sys.stdout.flush()
+        stop.wait(max(0.0, interval - (time.monotonic() - started)))
+    return 0
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -495,41 +2174,51 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument("--news-file", default="news.html")
     parser.add_argument("--resources-file", default="resources.html")
     parser.add_argument("--feed-file", default="feed.xml")
+    parser.add_argument("--json-feed-file", default="feed.json",
+                        help="JSON Feed version of feed.xml (empty to skip)")
+    parser.add_argument("--tag-feed-dir", default="feeds",
+                        help="Directory for one RSS feed per tag, e.g. feeds/aws.xml (empty to skip)")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR,
+                        help="Directory for the paginated JSON archive of every story (empty to skip)")
     parser.add_argument("--max-articles", type=int, default=120)
+    parser.add_argument("--page-articles", type=int, default=40,
+                        help="Cards kept in news.html when the archive is written; older ones load on scroll")
     parser.add_argument("--min-sources", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS,
+                        help="Maximum number of feeds fetched at once")
+    parser.add_argument("--per-host", type=int, default=FETCH_PER_HOST,
+                        help="Maximum concurrent requests to a single host")
+    parser.add_argument("--max-items-per-feed", type=int, default=FEED_ITEM_LIMIT,
+                        help="Read at most this many of the newest items from each feed")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help="Directory for feed and redirect caches between runs")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached feeds and redirects and fetch everything again")
+    parser.add_argument("--full-render", action="store_true",
+                        help="Re-render every card instead of reusing cards already on the page")
+    parser.add_argument("--db", default=ARTICLE_DB,
+                        help="SQLite article store that news.html and feed.xml are rendered from")
+    parser.add_argument("--min-relevance", type=float, default=RELEVANCE_MIN_SCORE,
+                        help="Drop new articles whose similarity to past articles is below this (0 keeps all)")
+    parser.add_argument("--all-feeds", action="store_true",
+                        help="Poll every feed, not just the ones whose schedule says they are due")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep running and update every --interval seconds until stopped")
+    parser.add_argument("--interval", type=float, default=DAEMON_INTERVAL,
+                        help="Seconds between updates in --daemon mode")
+    parser.add_argument("--stats", choices=["table", "json"],
+                        help="Print per-feed timings, counters and stage durations after the run")
+    parser.add_argument("--stats-file",
+                        help="Also write the run statistics as JSON to this file")
     args = parser.parse_args(argv)
 
+    updater = NewsUpdater(args)
     try:
-        entries, newest_iso = build_entries(args.news_file, args.resources_file, args.max_articles, args.min_sources)
-    except Exception as exc:
-        print(f"Error: {exc}", file=sys.stderr)
-        return 1
-
-    indent = " " * 16
-    cards_html = "\n".join(render_card(entry, indent) for entry in entries)
-
-    try:
-        with open(args.news_file, "r", encoding="utf-8") as f:
-            html_text = f.read()
-    except FileNotFoundError:
-        print(f"Error: {args.news_file} not found", file=sys.stderr)
-        return 1
-
-    html_text = replace_grid(html_text, cards_html)
-    html_text = update_date_modified(html_text, newest_iso)
-
-    with open(args.news_file, "w", encoding="utf-8") as f:
-        f.write(html_text)
-
-    feed_xml = build_feed_xml(entries, newest_iso)
-    with open(args.feed_file, "w", encoding="utf-8") as f:
-        f.write(feed_xml)
-
-    print(
-        f"Updated {args.news_file} and {args.feed_file} with {len(entries)} articles "
-        f"from {len({e['source'] for e in entries})} sources."
-    )
-    return 0
+        if args.daemon:
+            return run_daemon(updater, args.interval)
+        return updater.run_once()
+    finally:
+        updater.close()
 
 
 if __name__ == "__main__":
@@ -5,12 +5,18 @@ Calculates SHA-384 hashes for main.js and style.css and updates all HTML files
 with the new integrity attributes automatically.
 """
 
+import argparse
 import hashlib
 import base64
+import json
+import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent / 'tools'))
+from artifact_writer import ArtifactWriter, atomic_write  # noqa: E402
 
 
 def upsert_attr(tag: str, attr: str, value: str) -> str:
@@ -63,14 +69,104 @@ def calculate_cache_bust(file_path: Path) -> str:
     return sha256.hexdigest()[:8]
 
 
+class Asset(NamedTuple):
+    """A hashed asset: the tag and attribute that load it, and the URL written there."""
+    tag: str
+    attr: str
+    url: str
+
+
+# Every asset whose SRI hash and cache-bust param are kept up to date.
+# breach-timeline.html loads its own assets by relative URL, so those keep
+# no leading slash.
+ASSETS: Dict[str, Asset] = {
+    'style.css': Asset('link', 'href', '/style.css'),
+    'main.js': Asset('script', 'src', '/main.js'),
+    'chat-resources.js': Asset('script', 'src', '/chat-resources.js'),
+    'breach-timeline.css': Asset('link', 'href', 'breach-timeline.css'),
+    'breach-timeline.js': Asset('script', 'src', 'breach-timeline.js'),
+}
+
+# --fingerprint mode: style.css is served as a copy named style.<8 hex>.css
+# (the same 8 hex as the ?v= tag). Matches those copies and references to them.
+FINGERPRINT_PATTERN = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{8})(?P<ext>\.\w+)$')
+
+# Asset hashes and the assets each HTML file references, from the last run
+MANIFEST_PATH = Path('.cache') / 'sri-manifest.json'
+
+# Any <link> or <script> opening tag, and an href/src reference inside one
+# to a file in the site root (optionally written ./file or /file).
+TAG_PATTERN = re.compile(r'<(link|script)\b[^>]*>', re.IGNORECASE)
+REF_PATTERN = re.compile(
+    r'\b(href|src)=(["\'])(?:\.?/)?([\w.-]+)(?:\?[^"\']*)?(["\'])',
+    re.IGNORECASE,
+)
+
+
+def fingerprinted(name: str, cache_bust: str) -> str:
+    """File name of an asset's fingerprinted copy, e.g. style.3fa2c1d9.css."""
+    stem, ext = os.path.splitext(name)
+    return f'{stem}.{cache_bust}{ext}'
+
+
+def asset_name(file_name: str) -> Optional[str]:
+    """The ASSETS name a referenced file stands for, fingerprinted or not."""
+    name = file_name.lower()
+    if name in ASSETS:
+        return name
+    match = FINGERPRINT_PATTERN.match(name)
+    if match and match.group('stem') + match.group('ext') in ASSETS:
+        return match.group('stem') + match.group('ext')
+    return None
+
+
+def rewrite_asset_tags(content: str, hashes: Dict[str, str],
+                       cache_busts: Dict[str, str],
+                       found: Optional[Set[str]] = None,
+                       fingerprint: bool = False) -> str:
+    """Update every asset tag in one pass over ``content``.
+
+    Tags referencing an asset in ASSETS (or a fingerprinted copy of one) get
+    its cache-bust URL, or the fingerprinted file name with ``fingerprint``,
+    its integrity hash and no crossorigin attribute (not needed for
+    same-origin files, and it made mobile browsers block the CSS). The
+    names of the assets referenced are added to ``found``.
+    """
+    def replace_tag(match: re.Match) -> str:
+        tag = match.group(0)
+        tag_name = match.group(1).lower()
+        for ref in REF_PATTERN.finditer(tag):
+            name = asset_name(ref.group(3))
+            asset = ASSETS.get(name)
+            if (asset is None or name not in hashes
+                    or asset.tag != tag_name or asset.attr != ref.group(1).lower()):
+                continue
+            if found is not None:
+                found.add(name)
+            if fingerprint:
+                url = asset.url[:-len(name)] + fingerprinted(name, cache_busts[name])
+            else:
+                url = f'{asset.url}?v={cache_busts[name]}'
+            tag = f'{tag[:ref.start()]}{ref.group(1)}={ref.group(2)}{url}{ref.group(4)}{tag[ref.end():]}'
+            tag = upsert_attr(tag, 'integrity', hashes[name])
+            return remove_attr(tag, 'crossorigin')
+        return tag
+
+    return TAG_PATTERN.sub(replace_tag, content)
+
+
 def update_html_file(html_path: Path, hashes: Dict[str, str],
-                     cache_busts: Dict[str, str]) -> bool:
+                     cache_busts: Dict[str, str], writer: ArtifactWriter,
+                     found: Optional[Set[str]] = None, fingerprint: bool = False) -> bool:
     """Update SRI hashes and cache-bust params in an HTML file.
 
     Args:
         html_path: Path to the HTML file
         hashes: Dictionary mapping file names to their SRI hashes
         cache_busts: Dictionary mapping file names to cache-bust strings
+        writer: Writes the file atomically, and only if its content changed
+        found: If given, receives the names of the assets the file references
+        fingerprint: Reference fingerprinted copies instead of ?v= URLs
 
     Returns:
         True if file was modified, False otherwise
@@ -78,137 +174,127 @@ def update_html_file(html_path: Path, hashes: Dict[str, str],
     with open(html_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    original_content = content
-
-    # Update style.css: SRI hash, cache-bust param, remove crossorigin
-    if 'style.css' in hashes:
-        link_pattern = re.compile(
-            r'<link\b[^>]*\bhref=(["\'])(?:\.?/)?style\.css(?:\?[^"\']*)?(\1)[^>]*>',
-            re.IGNORECASE,
-        )
-
-        def replace_style_link(match: re.Match) -> str:
-            tag = match.group(0)
-            # Update href to include cache-bust query param
-            tag = re.sub(
-                r'(href=["\'])(?:\.?/)?style\.css(?:\?[^"\']*)?(["\'])',
-                rf'\g<1>/style.css?v={cache_busts["style.css"]}\2',
-                tag,
-            )
-            tag = upsert_attr(tag, 'integrity', hashes['style.css'])
-            tag = remove_attr(tag, 'crossorigin')
-            return tag
-
-        content = link_pattern.sub(replace_style_link, content)
-
-    # Update main.js: SRI hash, cache-bust param, remove crossorigin
-    if 'main.js' in hashes:
-        script_pattern = re.compile(
-            r'<script\b[^>]*\bsrc=(["\'])(?:\.?/)?main\.js(?:\?[^"\']*)?(\1)[^>]*>',
-            re.IGNORECASE,
-        )
-
-        def replace_main_script(match: re.Match) -> str:
-            tag = match.group(0)
-            # Update src to include cache-bust query param
-            tag = re.sub(
-                r'(src=["\'])(?:\.?/)?main\.js(?:\?[^"\']*)?(["\'])',
-                rf'\g<1>/main.js?v={cache_busts["main.js"]}\2',
-                tag,
-            )
-            tag = upsert_attr(tag, 'integrity', hashes['main.js'])
-            tag = remove_attr(tag, 'crossorigin')
-            return tag
-
-        content = script_pattern.sub(replace_main_script, content)
-
-    # Update chat-resources.js: SRI hash, cache-bust param, remove crossorigin
-    if 'chat-resources.js' in hashes:
-        chat_script_pattern = re.compile(
-            r'<script\b[^>]*\bsrc=(["\'])(?:\.?/)?chat-resources\.js(?:\?[^"\']*)?(\1)[^>]*>',
-            re.IGNORECASE,
-        )
-
-        def replace_chat_script(match: re.Match) -> str:
-            tag = match.group(0)
-            tag = re.sub(
-                r'(src=["\'])(?:\.?/)?chat-resources\.js(?:\?[^"\']*)?(["\'])',
-                rf'\g<1>/chat-resources.js?v={cache_busts["chat-resources.js"]}\2',
-                tag,
-            )
-            tag = upsert_attr(tag, 'integrity', hashes['chat-resources.js'])
-            tag = remove_attr(tag, 'crossorigin')
-            return tag
-
-        content = chat_script_pattern.sub(replace_chat_script, content)
-
-    # Update breach-timeline.css: SRI hash, cache-bust param, remove crossorigin
-    if 'breach-timeline.css' in hashes:
-        bt_link_pattern = re.compile(
-            r'<link\b[^>]*\bhref=(["\'])(?:\.?/)?breach-timeline\.css(?:\?[^"\']*)?(\1)[^>]*>',
-            re.IGNORECASE,
-        )
-
-        def replace_bt_style_link(match: re.Match) -> str:
-            tag = match.group(0)
-            tag = re.sub(
-                r'(href=["\'])(?:\.?/)?breach-timeline\.css(?:\?[^"\']*)?(["\'])',
-                rf'\g<1>breach-timeline.css?v={cache_busts["breach-timeline.css"]}\2',
-                tag,
-            )
-            tag = upsert_attr(tag, 'integrity', hashes['breach-timeline.css'])
-            tag = remove_attr(tag, 'crossorigin')
-            return tag
-
-        content = bt_link_pattern.sub(replace_bt_style_link, content)
-
-    # Update breach-timeline.js: SRI hash, cache-bust param, remove crossorigin
-    if 'breach-timeline.js' in hashes:
-        bt_script_pattern = re.compile(
-            r'<script\b[^>]*\bsrc=(["\'])(?:\.?/)?breach-timeline\.js(?:\?[^"\']*)?(\1)[^>]*>',
-            re.IGNORECASE,
-        )
-
-        def replace_bt_script(match: re.Match) -> str:
-            tag = match.group(0)
-            tag = re.sub(
-                r'(src=["\'])(?:\.?/)?breach-timeline\.js(?:\?[^"\']*)?(["\'])',
-                rf'\g<1>breach-timeline.js?v={cache_busts["breach-timeline.js"]}\2',
-                tag,
-            )
-            tag = upsert_attr(tag, 'integrity', hashes['breach-timeline.js'])
-            tag = remove_attr(tag, 'crossorigin')
-            return tag
-
-        content = bt_script_pattern.sub(replace_bt_script, content)
+    updated = rewrite_asset_tags(content, hashes, cache_busts, found, fingerprint)
 
     # Write back if changed
-    if content != original_content:
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
+    if updated != content:
+        return writer.write(html_path, updated)
 
     return False
 
 
-def main():
+def sync_fingerprinted_copies(repo_root: Path, cache_busts: Dict[str, str],
+                              writer: ArtifactWriter, keep: bool) -> None:
+    """Write the current fingerprinted copy of each asset (if ``keep``) and
+    remove every other one, so only copies the pages reference remain."""
+    for name, cache_bust in cache_busts.items():
+        current = fingerprinted(name, cache_bust)
+        if keep:
+            writer.write(repo_root / current, (repo_root / name).read_bytes())
+        stem, ext = os.path.splitext(name)
+        for path in repo_root.glob(f'{stem}.*{ext}'):
+            match = FINGERPRINT_PATTERN.match(path.name)
+            if (match and match.group('stem') == stem and match.group('ext') == ext
+                    and not (keep and path.name == current)):
+                writer.remove(path)
+
+
+def find_html_files(repo_root: Path) -> List[Path]:
+    """Every .html file under ``repo_root``, skipping hidden directories (.git, .cache, ...)."""
+    html_files = []
+    for directory, dirs, files in os.walk(repo_root):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        html_files.extend(Path(directory) / name for name in files if name.endswith('.html'))
+    return sorted(html_files)
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+class Manifest:
+    """What the last run saw, so the next one can skip unchanged work.
+
+    ``assets`` maps each asset to the size, mtime and hashes it had;
+    ``pages`` maps each HTML file (relative path) to its size and mtime
+    after the run and the assets it references. An asset whose size and
+    mtime are unchanged is not hashed again, and a page is only read when
+    it changed itself or references an asset whose hash changed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.assets: Dict[str, Dict] = {}
+        self.pages: Dict[str, Dict] = {}
+        self.fingerprint = False
+
+    def load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self.assets = data.get('assets', {})
+            self.pages = data.get('pages', {})
+            self.fingerprint = data.get('fingerprint', False)
+
+    def save(self) -> None:
+        data = {'version': self.VERSION, 'fingerprint': self.fingerprint,
+                'assets': self.assets, 'pages': self.pages}
+        atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+    def asset_hashes(self, name: str, path: Path) -> Tuple[str, str, bool]:
+        """SRI hash and cache-bust string of an asset, and whether they changed."""
+        size, mtime_ns = _stat_key(path)
+        entry = self.assets.get(name)
+        if entry and entry['size'] == size and entry['mtime_ns'] == mtime_ns:
+            return entry['sri'], entry['cache_bust'], False
+        sri_hash, cache_bust = calculate_sri_hash(path), calculate_cache_bust(path)
+        self.assets[name] = {'size': size, 'mtime_ns': mtime_ns,
+                             'sri': sri_hash, 'cache_bust': cache_bust}
+        return sri_hash, cache_bust, not entry or entry['sri'] != sri_hash
+
+    def page_is_current(self, key: str, path: Path, changed_assets: Set[str]) -> bool:
+        entry = self.pages.get(key)
+        if not entry or [entry['size'], entry['mtime_ns']] != list(_stat_key(path)):
+            return False
+        return not changed_assets.intersection(entry['assets'])
+
+    def record_page(self, key: str, path: Path, assets: Set[str]) -> None:
+        size, mtime_ns = _stat_key(path)
+        self.pages[key] = {'size': size, 'mtime_ns': mtime_ns, 'assets': sorted(assets)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function to update SRI hashes in all HTML files."""
     # Get the repository root directory
     repo_root = Path(__file__).parent
-    
+
+    parser = argparse.ArgumentParser(description='Update SRI hashes and cache-bust params in HTML files')
+    parser.add_argument('--manifest', type=Path, default=repo_root / MANIFEST_PATH,
+                        help='Where asset hashes and page references are remembered between runs')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the manifest: hash every asset and check every HTML file')
+    parser.add_argument('--fingerprint', action='store_true',
+                        help='Reference hash-named copies (style.<hash>.css) instead of ?v= URLs')
+    args = parser.parse_args(argv)
+
+    manifest = Manifest(args.manifest)
+    if not args.full:
+        manifest.load()
+
     # Files to calculate hashes for
-    files_to_hash = {
-        'style.css': repo_root / 'style.css',
-        'main.js': repo_root / 'main.js',
-        'chat-resources.js': repo_root / 'chat-resources.js',
-        'breach-timeline.css': repo_root / 'breach-timeline.css',
-        'breach-timeline.js': repo_root / 'breach-timeline.js',
-    }
+    files_to_hash = {name: repo_root / name for name in ASSETS}
     
     # Calculate SRI hashes and cache-bust strings
     print("Calculating SRI hashes...")
     hashes = {}
     cache_busts = {}
+    changed_assets = set()
     missing_files = []
 
     for name, path in files_to_hash.items():
@@ -216,34 +302,62 @@ def main():
             missing_files.append(str(path))
             continue
 
-        sri_hash = calculate_sri_hash(path)
+        sri_hash, cache_bust, changed = manifest.asset_hashes(name, path)
         hashes[name] = sri_hash
-        cache_busts[name] = calculate_cache_bust(path)
-        print(f"  {name}: {sri_hash} (v={cache_busts[name]})")
+        cache_busts[name] = cache_bust
+        if changed:
+            changed_assets.add(name)
+        print(f"  {name}: {sri_hash} (v={cache_busts[name]}){' [changed]' if changed else ''}")
 
     # If any required files are missing, exit with error
     if missing_files:
         print(f"Error: Required files not found: {', '.join(missing_files)}", file=sys.stderr)
         return 1
 
+    # Switching between ?v= URLs and fingerprinted names rewrites every reference
+    if manifest.fingerprint != args.fingerprint:
+        changed_assets = set(hashes)
+        manifest.fingerprint = args.fingerprint
+
+    writer = ArtifactWriter()
+    sync_fingerprinted_copies(repo_root, cache_busts, writer, keep=args.fingerprint)
+    for path in writer.changed:
+        print(f"  ✓ Wrote: {Path(path).name}")
+    for path in writer.removed:
+        print(f"  ✗ Removed: {Path(path).name}")
+
     # Find all HTML files recursively in the repository
-    html_files = list(repo_root.rglob('*.html'))
+    html_files = find_html_files(repo_root)
 
     if not html_files:
         print("Warning: No HTML files found", file=sys.stderr)
         return 0
 
-    # Update each HTML file
+    # Update each HTML file that changed or references a changed asset
     print(f"\nUpdating {len(html_files)} HTML files...")
-    modified_count = 0
-    for html_path in sorted(html_files):
-        if update_html_file(html_path, hashes, cache_busts):
+    copies = len(writer.changed)
+    skipped = 0
+    pages = {}
+    for html_path in html_files:
+        key = html_path.relative_to(repo_root).as_posix()
+        if manifest.page_is_current(key, html_path, changed_assets):
+            pages[key] = manifest.pages[key]
+            skipped += 1
+            continue
+        found: Set[str] = set()
+        if update_html_file(html_path, hashes, cache_busts, writer, found, args.fingerprint):
             print(f"  ✓ Updated: {html_path.name}")
-            modified_count += 1
         else:
             print(f"  - Unchanged: {html_path.name}")
-    
-    print(f"\n✓ Done! Modified {modified_count} of {len(html_files)} files.")
+        manifest.record_page(key, html_path, found)
+        pages[key] = manifest.pages[key]
+    # Deleted pages drop out of the reverse index
+    manifest.pages = pages
+    manifest.save()
+
+    if skipped:
+        print(f"  (skipped {skipped} unchanged files that reference no changed asset)")
+    print(f"\n✓ Done! Modified {len(writer.changed) - copies} of {len(html_files)} files.")
     return 0
 
 